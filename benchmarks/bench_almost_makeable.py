@@ -0,0 +1,99 @@
+"""
+bench_almost_makeable.py
+
+Speed of the "almost makeable" query (IngredientIndex.almost_makeable, data/ingredient_index.py) against
+a per-recipe Python loop counting the ingredients missing from the shelf, for the bundled recipes and
+synthetic sets of 100x / 200k recipes (see bench_ingredient_index.py), with k = 0..3 missing ingredients
+and a growing shelf.
+The second table times the whole "What Can I Make?" path in the cocktail window (ui/cocktail_window.py):
+opening the window, then changing "Missing at most" to k (query, table update and repaint), offscreen.
+
+Run from the project root:
+    python -m benchmarks.bench_almost_makeable
+"""
+import os
+import tempfile
+import time
+import numpy as np
+from benchmarks.bench_ingredient_index import SHELF, SIZES, synthetic_lists
+from data.cocktails import load_cocktails
+from data.data_handler import ASSETS_DIR
+from data.ingredient_index import IngredientIndex
+from data.user_store import UserStore
+from utils.ingredients_mapper import FAMILY_OF
+
+MAX_MISSING = [0, 1, 2, 3]
+REPEAT = 10
+
+
+def loop_almost_makeable(lists, shelf, max_missing):
+    # Previous style: one Python test per recipe
+    counts = [len(set(ings) - shelf) for ings in lists]
+    rows = [row for row, count in enumerate(counts) if count <= max_missing]
+    return sorted(rows, key=lambda row: counts[row])
+
+
+def bench_window(df, all_lists):
+    # Cocktail window over `lists` (rows of the bundled recipes repeated for the table text)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from ui.cocktail_window import CocktailsWindow
+    app = QApplication.instance() or QApplication([])
+
+    print(f"\n{'recipes':>9} {'open':>9} " + " ".join(f"{f'k={k}':>9} {'rows':>7}" for k in MAX_MISSING))
+    with tempfile.TemporaryDirectory() as tmp:
+        store = UserStore(os.path.join(tmp, "user.sqlite3"), {}, None)
+        store.update_shelf(added=SHELF)
+        for lists in all_lists:
+            recipes = df.iloc[np.arange(len(lists)) % len(df)].reset_index(drop=True)
+            index = IngredientIndex.from_lists(lists)
+            families = [FAMILY_OF.get(ing, "Other") for ing in index.ingredients]   # For the ingredient filter
+            cocktails = (recipes, IngredientIndex(index.ingredients, index.recipe_ids, index.indptr, families))
+            start = time.perf_counter()
+            window = CocktailsWindow("", cocktails=cocktails, store=store)
+            window.show()
+            app.processEvents()
+            line = f"{len(lists):>9,} {(time.perf_counter() - start) * 1000:>6.0f} ms"
+
+            window.show_makeable()
+            for k in MAX_MISSING:
+                start = time.perf_counter()
+                window.missing_spin.setValue(k)
+                window.show_makeable()      # Also for k = 0, where the spin value doesn't change
+                app.processEvents()         # Paint the visible rows
+                line += f" {(time.perf_counter() - start) * 1000:>6.1f} ms {window.table_model.rowCount():>7,}"
+            print(line)
+            window.close()
+
+
+def main():
+    df, index = load_cocktails(os.path.join(ASSETS_DIR, "all_drinks_metric.csv"))
+    base = [
+        [index.ingredients[i] for i in index.recipe_ids[start:end]]
+        for start, end in zip(index.indptr[:-1], index.indptr[1:])
+    ]
+    print(f"{'recipes':>9} {'shelf':>6} {'k':>2} {'loop':>10} {'index':>9} {'found':>8}")
+    all_lists = [base] + [synthetic_lists(base, size) for size in SIZES]
+    for lists in all_lists:
+        index = IngredientIndex.from_lists(lists)
+        for shelf_size in (4, len(SHELF)):
+            shelf = set(SHELF[:shelf_size])
+            for k in MAX_MISSING:
+                start = time.perf_counter()
+                expected = loop_almost_makeable(lists, shelf, k)
+                loop_time = (time.perf_counter() - start) * 1000
+
+                start = time.perf_counter()
+                for _ in range(REPEAT):
+                    rows, _ = index.almost_makeable(shelf, k)
+                index_time = (time.perf_counter() - start) / REPEAT * 1000
+                assert rows.tolist() == expected
+
+                print(f"{len(lists):>9,} {shelf_size:>6} {k:>2} {loop_time:>7.2f} ms {index_time:>6.2f} ms"
+                      f" {len(rows):>8,}")
+
+    bench_window(df, all_lists)
+
+
+if __name__ == "__main__":
+    main()
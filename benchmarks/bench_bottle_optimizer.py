@@ -0,0 +1,80 @@
+"""
+bench_bottle_optimizer.py
+
+Speed of "Which Bottles to Buy?" (BottleOptimizer.suggest, data/purchase_optimizer.py) with the bundled Alko
+price list, for the bundled recipes and synthetic sets of 100x / 200k recipes (see bench_ingredient_index.py),
+against a single-bottle greedy written as a Python loop over the recipes' ingredient sets (skipped for 200k).
+The suggestion has to come back well under a second to be recomputed as the budget is edited.
+
+Run from the project root:
+    python -m benchmarks.bench_bottle_optimizer
+"""
+import os
+import time
+from benchmarks.bench_ingredient_index import SHELF, SIZES, synthetic_lists
+from data.cocktails import load_cocktails
+from data.data_handler import ASSETS_DIR, BACKUP_FILENAME, load_price_list
+from data.ingredient_index import IngredientIndex
+from data.purchase_optimizer import BottleOptimizer
+from utils.ingredients_mapper import ALKO_PRODUCTS
+
+BUDGET = 150.0
+BOTTLES = 10
+LOOP_MAX_RECIPES = 60_000   # The Python loop takes minutes beyond this
+
+
+def loop_suggest(lists, prices, shelf, budget, max_bottles):
+    # Baseline: buy one bottle at a time, testing every buyable bottle against every recipe
+    have = set(shelf) | {ing for ings in lists for ing in ings if ing not in ALKO_PRODUCTS}
+    recipes = [set(ings) for ings in lists]
+    makeable = sum(ings <= have for ings in recipes)
+    picks = []
+    while len(picks) < max_bottles:
+        best = None
+        for ing, price in prices.items():
+            if ing in have or price > budget:
+                continue
+            gain = sum(ings <= have | {ing} for ings in recipes) - makeable
+            if gain and (best is None or gain / price > best[0]):
+                best = (gain / price, ing, gain)
+        if best is None:
+            break
+        _, ing, gain = best
+        have.add(ing)
+        makeable += gain
+        budget -= prices[ing]
+        picks.append(ing)
+    return picks
+
+
+def main():
+    alko_df = load_price_list(BACKUP_FILENAME)[0]
+    index = load_cocktails(os.path.join(ASSETS_DIR, "all_drinks_metric.csv"))[1]
+    base = [
+        [index.ingredients[i] for i in index.recipe_ids[start:end]]
+        for start, end in zip(index.indptr[:-1], index.indptr[1:])
+    ]
+    print(f"{'recipes':>9} {'shelf':>6} {'loop':>10} {'optimizer':>10} {'bottles':>8} {'unlocked':>9}")
+    for lists in [base] + [synthetic_lists(base, size) for size in SIZES]:
+        index = IngredientIndex.from_lists(lists)
+        optimizer = BottleOptimizer(alko_df, index)
+        prices = {ing: float(alko_df["Hinta"].iat[row]) for ing, row in optimizer.products.items()}
+        for shelf_size in (0, len(SHELF)):
+            shelf = set(SHELF[:shelf_size])
+            loop_text = "-"
+            if len(lists) <= LOOP_MAX_RECIPES:
+                start = time.perf_counter()
+                loop_suggest(lists, prices, shelf, BUDGET, BOTTLES)
+                loop_text = f"{(time.perf_counter() - start) * 1000:.0f} ms"
+
+            start = time.perf_counter()
+            picks = optimizer.suggest(shelf, BUDGET, BOTTLES)
+            optimizer_time = (time.perf_counter() - start) * 1000
+
+            unlocked = sum(len(pick.unlocked) for pick in picks)
+            print(f"{len(lists):>9,} {shelf_size:>6} {loop_text:>10} {optimizer_time:>7.1f} ms"
+                  f" {len(picks):>8} {unlocked:>9,}")
+
+
+if __name__ == "__main__":
+    main()
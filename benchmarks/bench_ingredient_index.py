@@ -0,0 +1,70 @@
+"""
+bench_ingredient_index.py
+
+Speed check of the cocktail window's ingredient filters: the previous per-recipe Python test
+(`all(...)` over each recipe's ingredient list) against the bitset index (data/ingredient_index.py),
+for the bundled recipes and synthetic recipe sets up to 100x / 200k recipes (random ingredient
+combinations drawn from the bundled ones).
+
+Run from the project root:
+    python -m benchmarks.bench_ingredient_index
+"""
+import os
+import time
+import numpy as np
+from data.cocktails import load_cocktails
+from data.data_handler import ASSETS_DIR
+from data.ingredient_index import IngredientIndex
+
+SIZES = [54_600, 200_000]   # 100x the bundled recipes, and more
+CHECKED = ["Lime", "Rum"]
+SHELF = ["Rum", "White Rum", "Lime", "Sweetener", "Soda Water", "Herbs and Spices", "Ice", "Gin", "Lemon", "Vodka"]
+REPEAT = 20
+
+
+def synthetic_lists(base, size, seed=0):
+    """The real recipes first, then random recipes with the same length distribution and ingredient frequencies."""
+    rng = np.random.default_rng(seed)
+    pool = [ing for ings in base for ing in ings]
+    lengths = rng.choice([len(ings) for ings in base], size=size - len(base))
+    picks = rng.integers(len(pool), size=int(lengths.sum()))
+    out, start = list(base), 0
+    for length in lengths:
+        out.append(list(dict.fromkeys(pool[i] for i in picks[start:start + length])))
+        start += length
+    return out
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func()
+    return (time.perf_counter() - start) / REPEAT * 1000, result
+
+
+def main():
+    index = load_cocktails(os.path.join(ASSETS_DIR, "all_drinks_metric.csv"))[1]
+    base = [
+        [index.ingredients[i] for i in index.recipe_ids[start:end]]
+        for start, end in zip(index.indptr[:-1], index.indptr[1:])
+    ]
+    shelf = set(SHELF)
+    print(f"{'recipes':>9} {'build':>9} {'contains (loop / index)':>26} {'makeable (loop / index)':>26}")
+    for lists in [base] + [synthetic_lists(base, size) for size in SIZES]:
+        start = time.perf_counter()
+        index = IngredientIndex.from_lists(lists)
+        build = time.perf_counter() - start
+
+        loop_contains, expected = timed(lambda: [all(chip in ings for chip in CHECKED) for ings in lists])
+        index_contains, found = timed(lambda: index.containing_all(CHECKED))
+        assert found.tolist() == expected
+        loop_makeable, expected = timed(lambda: [all(i in shelf for i in ings) for ings in lists])
+        index_makeable, found = timed(lambda: index.makeable(shelf))
+        assert found.tolist() == expected
+
+        print(f"{len(lists):>9,} {build:>7.3f} s {loop_contains:>11.2f} / {index_contains:>6.3f} ms"
+              f" {loop_makeable:>11.2f} / {index_makeable:>6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+bench_match_blocking.py
+
+Recall and speed check of token blocking (data/match_blocking.py) against the exhaustive cdist matcher,
+for the Alko whiskeys against the bundled WhiskyScores set and against larger synthetic rating sets
+(the bundled names plus variants with extra edition/cask/batch words, up to 100k entries).
+
+Recall = share of the exhaustive matcher's matches that blocking finds too.
+
+Run from the project root:
+    python -m benchmarks.bench_match_blocking [path/to/price_list.xlsx]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from rapidfuzz import process, fuzz
+from data.data_handler import BACKUP_FILENAME, load_price_list
+from data.match_blocking import TokenBlockingIndex, blocked_best_matches, recall
+from data.ratings import WHISKEY_RATINGS_FILE, clean_whiskey_names, select_products
+
+SIZES = [20_000, 100_000]
+EXTRA_WORDS = [
+    "cask strength", "batch", "limited edition", "sherry cask", "port finish",
+    "distillery edition", "small batch", "bottled", "vintage",
+]
+THRESHOLD = 85
+
+
+def exhaustive_matches(names, choices, threshold):
+    # Every name against every entry (what best_matches does below BLOCKING_MIN_CHOICES)
+    scores = process.cdist(
+        names, choices, scorer=fuzz.token_sort_ratio, score_cutoff=threshold, dtype=np.float64, workers=-1
+    )
+    best = scores.argmax(axis=1)
+    return np.where(scores[np.arange(len(names)), best] >= threshold, best, -1)
+
+
+def synthetic_choices(base, size, seed=0):
+    """The real entries first, then random variants of them up to `size` entries."""
+    rng = np.random.default_rng(seed)
+    variants = [
+        f"{base[i % len(base)]} {EXTRA_WORDS[rng.integers(len(EXTRA_WORDS))]} {rng.integers(1, 400)}"
+        for i in range(size - len(base))
+    ]
+    return base + variants
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else BACKUP_FILENAME
+    alko_df = load_price_list(path)[0]
+    names = clean_whiskey_names(select_products(alko_df, "viski")["Tuotenimi"]).tolist()
+    base = clean_whiskey_names(pd.read_excel(WHISKEY_RATINGS_FILE)["Whiskey"]).tolist()
+
+    print(f"{len(names)} Alko whiskeys, threshold {THRESHOLD}")
+    print(f"{'ratings':>9} {'exhaustive':>11} {'blocked':>9} {'speedup':>8} {'recall':>8}")
+    for choices in [base] + [synthetic_choices(base, size) for size in SIZES]:
+        start = time.perf_counter()
+        expected = exhaustive_matches(names, choices, THRESHOLD)
+        exhaustive_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = blocked_best_matches(names, choices, THRESHOLD, TokenBlockingIndex(choices))
+        blocked_time = time.perf_counter() - start   # Includes building the index
+
+        print(f"{len(choices):>9,} {exhaustive_time:>9.2f} s {blocked_time:>7.2f} s "
+              f"{exhaustive_time / blocked_time:>7.1f}x {recall(found, expected):>8.2%}")
+
+    # Which exhaustive matches blocking misses on the real set (usually a different distillery scoring >= 85)
+    expected = exhaustive_matches(names, base, THRESHOLD)
+    found = blocked_best_matches(names, base, THRESHOLD)
+    for i in np.flatnonzero((expected >= 0) & (found != expected))[:10]:
+        print(f"  missed: {names[i]!r} -> {base[expected[i]]!r}")
+
+
+if __name__ == "__main__":
+    main()
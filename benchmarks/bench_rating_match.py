@@ -0,0 +1,66 @@
+"""
+bench_rating_match.py
+
+Compares the batched rating matcher (best_matches in data/ratings.py, one rapidfuzz cdist call)
+with the previous per-product process.extractOne loop and its string-equality row lookup.
+Only the matching step is timed; the rating workbooks are read once up front.
+
+Run from the project root:
+    python -m benchmarks.bench_rating_match [path/to/price_list.xlsx]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from rapidfuzz import process, fuzz
+from data.data_handler import BACKUP_FILENAME, load_price_list
+from data.ratings import (
+    RUM_RATINGS_FILE, WHISKEY_RATINGS_FILE, best_matches, clean_whiskey_names, select_products
+)
+
+
+def extract_one_loop(names, choices: pd.Series, threshold):
+    # Previous implementation: one extractOne call per product, then a scan to find the matched row
+    positions = []
+    for name in names:
+        match = process.extractOne(name, choices, scorer=fuzz.token_sort_ratio)
+        if match and match[1] >= threshold:
+            positions.append(int(np.flatnonzero((choices == match[0]).to_numpy())[0]))
+        else:
+            positions.append(-1)
+    return np.array(positions)
+
+
+def best_time(func, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else BACKUP_FILENAME
+    alko_df = load_price_list(path)[0]
+
+    rums = select_products(alko_df, "rommi")["Tuotenimi"].str.lower().str.strip()
+    rum_choices = pd.read_excel(RUM_RATINGS_FILE)["Rum"].str.lower().str.strip()
+    whiskeys = clean_whiskey_names(select_products(alko_df, "viski")["Tuotenimi"])
+    whiskey_choices = clean_whiskey_names(pd.read_excel(WHISKEY_RATINGS_FILE)["Whiskey"])
+
+    print(f"{'dataset':<10} {'products x ratings':>20} {'extractOne loop':>16} {'cdist batch':>12} {'speedup':>8}")
+    for label, names, choices, threshold in (
+        ("rum", rums, rum_choices, 90),
+        ("whiskey", whiskeys, whiskey_choices, 85),
+    ):
+        loop_time, expected = best_time(lambda: extract_one_loop(names, choices, threshold), repeats=1)
+        batch_time, positions = best_time(lambda: best_matches(names, choices, threshold))
+        assert (positions == expected).all(), f"{label}: batched matches differ from extractOne"
+        shape = f"{len(names)} x {len(choices)}"
+        print(f"{label:<10} {shape:>20} {loop_time * 1000:>13.1f} ms {batch_time * 1000:>9.1f} ms "
+              f"{loop_time / batch_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+bench_recipe_index.py
+
+Cocktail recipe preprocessing (data/cocktails.py): the previous per-row df.apply over the 15 ingredient columns
+against the vectorized build_recipe_index(), and loading a saved recipe index file instead of preprocessing
+(reading the arrays back, splitting the display strings and building the IngredientIndex),
+for the bundled recipes and the recipes repeated 10x / 100x.
+
+Run from the project root:
+    python -m benchmarks.bench_recipe_index
+"""
+import os
+import tempfile
+import time
+import pandas as pd
+from data.cocktails import (
+    MAX_INGREDIENTS, build_recipe_index, display_columns, load_recipe_index, save_recipe_index
+)
+from data.ingredient_index import IngredientIndex
+from data.data_handler import ASSETS_DIR
+from utils.ingredients_mapper import normalize_ingredient
+
+FACTORS = [1, 10, 100]
+
+
+def apply_ingredient_lists(df):
+    # The preprocessing the cocktail window used to run on every open
+    def make_ing_list(row):
+        out = []
+        for i in range(1, MAX_INGREDIENTS + 1):
+            raw = row.get(f"strIngredient{i}")
+            if pd.notna(raw) and raw.strip():
+                out.append(normalize_ingredient(raw))
+        return out
+    return df.apply(make_ing_list, axis=1)
+
+
+def main():
+    base = pd.read_csv(os.path.join(ASSETS_DIR, "all_drinks_metric.csv"))
+    print(f"{'recipes':>9} {'df.apply':>10} {'vectorized':>11} {'index file':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "recipes.index.npz")
+        for factor in FACTORS:
+            df = pd.concat([base] * factor, ignore_index=True)
+
+            start = time.perf_counter()
+            apply_ingredient_lists(df)
+            apply_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            arrays = build_recipe_index(df)
+            build_time = time.perf_counter() - start
+
+            save_recipe_index(path, "bench", arrays)
+            start = time.perf_counter()
+            # What load_cocktails does with a saved index (besides reading the CSV)
+            loaded = load_recipe_index(path, "bench")
+            display_columns(loaded["display"], len(df))
+            IngredientIndex(loaded["ingredients"].tolist(), loaded["recipe_ids"], loaded["indptr"])
+            load_time = time.perf_counter() - start
+
+            print(f"{len(df):>9,} {apply_time:>8.3f} s {build_time:>9.3f} s {load_time:>9.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+bench_search_index.py
+
+Compares product name search with the trigram index (data/search_index.py) against the previous
+pandas scan (str.lower().str.contains) at 10k, 100k and 1M names. The larger catalogs repeat the
+price list names with a numeric suffix, so every name stays distinct.
+
+Run from the project root:
+    python -m benchmarks.bench_search_index [path/to/price_list.xlsx]
+"""
+import sys
+import time
+import pandas as pd
+from data.data_handler import BACKUP_FILENAME, load_price_list
+from data.search_index import TrigramIndex
+
+SIZES = [10_000, 100_000, 1_000_000]
+# Selective and common terms, as typed into the search box
+QUERIES = ["havana", "club", "gin", "koskenkorva", "12 years", "vodka", "ale", "chateau"]
+
+
+def make_names(base_names, size):
+    """`size` distinct names built from the real product names."""
+    return [f"{base_names[i % len(base_names)]} {i // len(base_names)}" for i in range(size)]
+
+
+def best_time(func, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else BACKUP_FILENAME
+    base_names = load_price_list(path)[0]["Tuotenimi"].tolist()
+
+    print(f"{'names':>9} {'index build':>12} {'str.contains':>14} {'trigram index':>14} {'speedup':>8}")
+    for size in SIZES:
+        names = make_names(base_names, size)
+        series = pd.Series(names)
+        build, index = best_time(lambda: TrigramIndex(names), repeats=1)
+
+        scan_total = index_total = 0.0
+        for query in QUERIES:
+            scan_time, mask = best_time(lambda: series.str.lower().str.contains(query, regex=False))
+            index_time, rows = best_time(lambda: index.search(query))
+            assert rows == mask.to_numpy().nonzero()[0].tolist(), query
+            scan_total += scan_time
+            index_total += index_time
+
+        scan_avg = scan_total / len(QUERIES) * 1000
+        index_avg = index_total / len(QUERIES) * 1000
+        print(f"{size:>9,} {build:>10.2f} s {scan_avg:>11.2f} ms {index_avg:>11.2f} ms {scan_avg / index_avg:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+bench_xlsx_reader.py
+
+Compares the column-projected streaming reader (data/xlsx_reader.py) with the previous
+pd.read_excel(header=3) path: parse time and peak Python memory (tracemalloc).
+
+Run from the project root:
+    python -m benchmarks.bench_xlsx_reader [path/to/price_list.xlsx]
+"""
+import sys
+import time
+import tracemalloc
+import warnings
+import pandas as pd
+from data.data_handler import BACKUP_FILENAME, read_price_list
+
+
+def read_full_workbook(path):
+    # Previous implementation: every column of the sheet is loaded into a DataFrame
+    return pd.read_excel(path, header=3, engine="openpyxl")
+
+
+def measure(label, func, path, repeats=3):
+    """Print best-of-N wall time and peak traced memory for func(path)."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    df = func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<28} {best:8.3f} s  {peak / 1e6:8.1f} MB peak  {df.shape[0]:>6} rows x {df.shape[1]} cols")
+    return best, peak
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else BACKUP_FILENAME
+    warnings.simplefilter("ignore")     # openpyxl warns about the workbook's missing default style
+    print(f"Workbook: {path}")
+    old_time, old_peak = measure("pd.read_excel (all columns)", read_full_workbook, path)
+    new_time, new_peak = measure("streaming, projected", read_price_list, path)
+    print(f"Speedup: {old_time / new_time:.2f}x, peak memory: {new_peak / old_peak:.0%} of previous")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+memory_report.py
+
+Reports the in-memory size of the processed price list per product, before (float64 columns,
+string categories, raw "Pullokoko" column) and after compact_price_list.
+
+Run from the project root:
+    python -m benchmarks.memory_report [path/to/price_list.xlsx]
+"""
+import sys
+import warnings
+from data.data_handler import BACKUP_FILENAME, read_price_list, clean_price_list, compact_price_list
+
+
+def report(label, df):
+    """Print total and per-product memory usage of df, column by column."""
+    usage = df.memory_usage(deep=True, index=False)
+    print(f"\n{label}: {usage.sum() / 1e6:.2f} MB, {usage.sum() / len(df):.1f} bytes per product")
+    for column, size in usage.items():
+        print(f"  {column:<16} {str(df[column].dtype):<10} {size / len(df):8.1f} B/product")
+    return usage.sum() / len(df)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else BACKUP_FILENAME
+    warnings.simplefilter("ignore")     # openpyxl warns about the workbook's missing default style
+    wide = clean_price_list(read_price_list(path), compact=False)
+
+    before = report("Before", wide)
+    after = report("After", compact_price_list(wide))
+    print(f"\n{len(wide)} products: {before:.1f} -> {after:.1f} bytes per product ({after / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+cli.py
+
+Headless command-line entry point (no PyQt6 needed), e.g. for scheduled runs:
+- Fetches the latest Alko price list (or processes a given workbook)
+- Matches rums and whiskeys against the community ratings
+- Writes the results as CSV, Parquet or JSON files
+
+Usage:
+    python cli.py --output results --format csv
+    python cli.py --input assets/alko_price_list_backup.xlsx --format json --ratings rum
+"""
+import argparse
+import os
+import sys
+import pandas as pd
+from data.data_handler import fetch_and_process_data, load_price_list
+from data.search_index import CategoryIndex
+from data.ratings import RATING_SOURCES, submit_rate_products
+
+FORMATS = ["csv", "parquet", "json"]
+
+
+def run(input_path=None, ratings=("rum", "whiskey"), include_user_ratings=True):
+    """
+    Library entry point: load the price list and run the rating matching.
+
+    Returns:
+    - Dict of result name -> DataFrame ("products", plus "rum_ratings" / "whiskey_ratings")
+    - A boolean indicating whether the backup price list was used
+    - DownloadResult of the price list fetch, or None (given input file or backup used)
+    """
+    download = None
+    if input_path:
+        df, _ = load_price_list(input_path)
+        used_backup = False
+    else:
+        df, used_backup, download = fetch_and_process_data()
+
+    results = {"products": df}
+    category_index = CategoryIndex(df["Tyyppi"])     # Shared by the matchers' category filters
+    # All rating sources are matched concurrently in the ratings engine's worker pool
+    futures = {
+        name: submit_rate_products(df, RATING_SOURCES[name], category_index, include_user_ratings)
+        for name in ratings
+    }
+    for name, future in futures.items():
+        rated = future.result()
+        if rated is not None:   # None: ratings file not available
+            results[f"{name}_ratings"] = rated
+    return results, used_backup, download
+
+
+def _export_frame(df):
+    """
+    Widen float32 columns for export via their shortest decimal form,
+    so a price of 22.99 isn't written as 22.9899997711.
+    """
+    df = df.copy()
+    for column in df.select_dtypes("float32").columns:
+        df[column] = pd.to_numeric(df[column].astype(str))
+    return df
+
+
+def write_results(results, output_dir, fmt):
+    """Write each result DataFrame to `output_dir/<name>.<fmt>`. Returns the written paths."""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for name, df in results.items():
+        path = os.path.join(output_dir, f"{name}.{fmt}")
+        df = _export_frame(df)
+        if fmt == "csv":
+            df.to_csv(path, index=False)
+        elif fmt == "parquet":
+            df.to_parquet(path, index=False)    # Needs pyarrow (or fastparquet) installed
+        else:
+            df.to_json(path, orient="records", force_ascii=False, indent=2)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch Alko data and match ratings without the GUI.")
+    parser.add_argument("--input", help="Process this price list workbook instead of fetching the latest one")
+    parser.add_argument("--output", default="results", help="Directory for the result files (default: results)")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="Output file format (default: csv)")
+    parser.add_argument("--ratings", nargs="*", choices=list(RATING_SOURCES), default=list(RATING_SOURCES),
+                        help="Rating sources to match (default: all)")
+    parser.add_argument("--no-user-ratings", action="store_true", help="Leave out the user's own ratings")
+    args = parser.parse_args(argv)
+
+    try:
+        results, used_backup, download = run(args.input, args.ratings, not args.no_user_ratings)
+        paths = write_results(results, args.output, args.format)
+    except ImportError as e:
+        print(f"Missing optional dependency for {args.format} output: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if used_backup:
+        print("Warning: latest fetch failed, used the backup Alko dataset.", file=sys.stderr)
+    if download is not None:
+        print(f"Price list {download.summary()}")
+    for name, path in zip(results, paths):
+        print(f"{path}: {len(results[name])} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+cocktails.py
+
+Loading of the cocktail recipe dataset (all_drinks_metric.csv) with the normalized ingredients of every recipe.
+Free of UI code, so the data can be prepared in the background before the cocktail window is opened.
+
+Preprocessing is vectorized: the 15 ingredient/measure columns are flattened into one long array of cells,
+and only the distinct raw ingredient names go through normalize_ingredient (a mapping lookup), so the work
+doesn't grow with a Python call per cell. The result (ingredient vocabulary and families, each recipe's
+ingredient ids, the display strings of the table) is saved as a recipe index file next to the CSV
+("all_drinks_metric.index.npz"), keyed on the CSV's hash, so later loads only read arrays back.
+"""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from data.ingredient_index import IngredientIndex
+from data.price_cache import file_digest
+from utils.ingredients_mapper import normalize_ingredient, FAMILY_OF
+
+# Recipes list up to 15 ingredients (strIngredient1..15) with matching measures (strMeasure1..15)
+MAX_INGREDIENTS = 15
+INGREDIENT_COLUMNS = [f"strIngredient{i}" for i in range(1, MAX_INGREDIENTS + 1)]
+MEASURE_COLUMNS = [f"strMeasure{i}" for i in range(1, MAX_INGREDIENTS + 1)]
+
+# Bump this whenever the preprocessing below changes; index files of another version are rebuilt
+RECIPE_INDEX_VERSION = 1
+
+# The display strings are stored as one UTF-8 text: recipes separated by RECORD_SEP, their parts by PART_SEP,
+# so loading is a replace + split over the whole text instead of padded fixed-width string arrays
+RECORD_SEP, PART_SEP = "\x1e", "\x1f"
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def recipe_index_path(csv_path: str) -> str:
+    """Recipe index file next to the CSV ("all_drinks_metric.index.npz")."""
+    return os.path.splitext(csv_path)[0] + ".index.npz"
+
+
+def _text_cells(df: pd.DataFrame, columns) -> pd.Series:
+    # The columns flattened row by row (recipe 0 ingredients 1..15, recipe 1 ...), missing cells as ""
+    cells = df[columns].to_numpy(dtype=object).ravel()
+    return pd.Series(cells, dtype=object).fillna("").astype(str)
+
+
+def _join_columns(parts: np.ndarray, shown: np.ndarray, sep: str) -> np.ndarray:
+    # Join the shown cells of each row with `sep`, one vectorized step per column (not per row)
+    joined = np.full(len(parts), "", dtype=object)
+    started = np.zeros(len(parts), dtype=bool)
+    for column in range(parts.shape[1]):
+        cells, show = parts[:, column], shown[:, column]
+        joined = np.where(show, np.where(started, joined + sep + cells, cells), joined)
+        started |= show
+    return joined
+
+
+def build_recipe_index(df: pd.DataFrame) -> dict:
+    """
+    Preprocess the recipes into arrays (the contents of the recipe index file):
+    - ingredients, families: normalized ingredient vocabulary (sorted, id = position) and the family of each
+    - recipe_ids, indptr:    ingredient ids of each recipe in CSR form, in recipe order (duplicates kept)
+    - display:               "measure ingredient" parts of every recipe (UTF-8, see RECORD_SEP/PART_SEP)
+    """
+    n = len(df)
+    recipe = np.repeat(np.arange(n), MAX_INGREDIENTS)   # Recipe of each flattened cell
+    raw = _text_cells(df, INGREDIENT_COLUMNS)
+    measures = _text_cells(df, MEASURE_COLUMNS)
+
+    # Normalized ingredients: only the distinct raw names are looked up
+    listed = (raw.str.strip() != "").to_numpy()
+    codes, uniques = pd.factorize(raw[listed])
+    canonical = np.array([normalize_ingredient(name) for name in uniques], dtype=object)
+    ingredients, canonical_ids = np.unique(canonical.astype(str), return_inverse=True)
+    recipe_ids = canonical_ids[codes]
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(recipe[listed], minlength=n))])
+
+    # Display strings ("29.6 mL Vodka"), as shown in the cocktail table
+    shown = (raw != "").to_numpy().reshape(n, MAX_INGREDIENTS)
+    parts = np.where(measures != "", measures.str.strip() + " " + raw.str.strip(), raw.str.strip())
+    parts = parts.astype(object).reshape(n, MAX_INGREDIENTS)
+    display = RECORD_SEP.join(_join_columns(parts, shown, PART_SEP))
+
+    return {
+        "ingredients": ingredients,
+        "families": np.asarray([FAMILY_OF.get(ing, "Other") for ing in ingredients], dtype=str),
+        "recipe_ids": recipe_ids.astype(np.int32),
+        "indptr": indptr.astype(np.int64),
+        "display": np.frombuffer(display.encode("utf-8"), dtype=np.uint8),
+    }
+
+
+def display_columns(display: np.ndarray, n: int):
+    """The table text (parts joined with ", ") and tooltip (joined with newlines) of the n recipes."""
+    if not n:
+        return [], []
+    text = display.tobytes().decode("utf-8")
+    return text.replace(PART_SEP, ", ").split(RECORD_SEP), text.replace(PART_SEP, "\n").split(RECORD_SEP)
+
+
+def load_recipe_index(path: str, source_hash: str):
+    """The saved recipe index arrays, or None if the file is missing, stale or unreadable."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            cached_hash, cached_version = archive["__meta__"].tolist()
+            if cached_hash != source_hash or int(cached_version) != RECIPE_INDEX_VERSION:
+                return None     # CSV or preprocessing changed -> rebuild
+            return {name: archive[name] for name in archive.files if name != "__meta__"}
+    except (OSError, KeyError, ValueError):
+        return None     # Corrupt or old-format index is treated as a miss
+
+
+def save_recipe_index(path: str, source_hash: str, arrays: dict):
+    """Write the recipe index via a temporary file, so a crash never leaves a half-written index."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(f, __meta__=np.asarray([source_hash, str(RECIPE_INDEX_VERSION)], dtype=str), **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_cocktails(csv_path: str):
+    """
+    Read the recipes with their preprocessed ingredients (from the recipe index file when it is up to date).
+
+    Returns:
+    - DataFrame of the CSV plus "ingredients_text"/"ingredients_tooltip" display columns
+    - IngredientIndex of the recipes' normalized ingredients (row positions match the DataFrame)
+    """
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"CSV not found: {csv_path}")
+    df = pd.read_csv(csv_path)
+
+    source_hash = file_digest(csv_path)
+    index_path = recipe_index_path(csv_path)
+    arrays = load_recipe_index(index_path, source_hash)
+    if arrays is None or len(arrays["indptr"]) != len(df) + 1:
+        arrays = build_recipe_index(df)
+        try:
+            save_recipe_index(index_path, source_hash, arrays)
+        except OSError:
+            pass    # Read-only install: just preprocess again next time
+
+    df["ingredients_text"], df["ingredients_tooltip"] = display_columns(arrays["display"], len(df))
+    index = IngredientIndex(
+        arrays["ingredients"].tolist(), arrays["recipe_ids"], arrays["indptr"], arrays["families"].tolist()
+    )
+    return df, index
+
+
+def submit_load_cocktails(csv_path: str) -> Future:
+    """Run load_cocktails() on a background thread; the caller gets a Future instead of waiting."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cocktails")
+    return _executor.submit(load_cocktails, csv_path)
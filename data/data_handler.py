@@ -1,12 +1,25 @@
 import os
-import requests
+import sqlite3
 import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from data.downloader import DownloadCancelled, download_file
+from data.price_cache import file_digest, load_cached_frame, save_cached_frame
+from data.price_history import PriceHistory
+from data.snapshot_diff import diff_price_lists
+from data.xlsx_reader import read_columns
 
 # URL to the latest price list Excel file from Alko's official site (Update link if data fetch fails)
 URL = "https://www.alko.fi/INTERSHOP/static/WFS/Alko-OnlineShop-Site/-/Alko-OnlineShop/fi_FI/Alkon%20Hinnasto%20Tekstitiedostona/alkon-hinnasto-tekstitiedostona.xlsx"
 
+# Content-type Alko serves the price list with
+EXCEL_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Price list columns needed for processing (everything else in the workbook is skipped)
+PRICE_LIST_TEXT_COLUMNS = ["Numero", "Nimi", "Pullokoko", "Tyyppi"]
+PRICE_LIST_NUMERIC_COLUMNS = ["Hinta", "Alkoholi-%"]
+
 # Determines the path to the 'assets' folder depending on environment:
 # - If the app is packaged with PyInstaller (.exe), use sys._MEIPASS
 # - Otherwise (development), use the local path to the "assets/" directory
@@ -36,6 +49,12 @@ FILENAME = os.path.join(USER_DATA_DIR, "alko_price_list.xlsx")
 # Ensure directory exists for saving the Excel file
 os.makedirs(USER_DATA_DIR, exist_ok=True)
 
+# Directory for the processed price list cache (see data/price_cache.py)
+CACHE_DIR = os.path.join(USER_DATA_DIR, "cache")
+
+# SQLite database with every fetched price list snapshot (see data/price_history.py)
+HISTORY_DB = os.path.join(USER_DATA_DIR, "price_history.sqlite3")
+
 
 def fetch_and_process_data():
     """
@@ -46,45 +65,125 @@ def fetch_and_process_data():
     Returns:
     - Cleaned and sorted DataFrame with alcohol-per-euro values
     - A boolean indicating whether the backup file was used
+    - DownloadResult of the fetch (bytes downloaded/saved, time), or None if the backup file was used
     """
+    read_path, download = download_price_list()
+    df, source_hash = load_price_list(read_path)
 
-    # Delete old file if it exists (ensures only newest version exists)
-    try:
-        if os.path.exists(FILENAME):
-            os.remove(FILENAME)
+    used_backup = read_path == BACKUP_FILENAME
+    if not used_backup:
+        record_price_history(df, source_hash)   # The backup file is old, so it's not a snapshot of today's prices
+    return df, used_backup, download
+
+
+def download_price_list(progress=None, should_cancel=None):
+    """
+    Brings the local price list up to date with Alko's published file.
+    The request is conditional (ETag/Last-Modified), so an unchanged file is not downloaded again,
+    and an interrupted download is resumed on the next call.
+    Falls back to the backup file if the fetch fails.
+    `progress` and `should_cancel` are passed on to download_file (cancelling raises DownloadCancelled).
 
+    Returns:
+    - Path of the workbook to read
+    - DownloadResult with transfer statistics, or None if the backup file was used
+    """
+    try:
         # Set user-agent to mimic a browser and avoid being blocked
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/114.0.0.0 Safari/537.36"
         }
 
-        # Perform GET request to download the Excel file
-        response = requests.get(URL, headers=headers)
-        response.raise_for_status()     # Raise an error if the request failed
-
         # Validate that the content is an Excel file (for troubleshooting)
-        content_type = response.headers.get("Content-Type", "")
-        if "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" not in response.headers.get("Content-Type",
-                                                                                                           ""):
-            raise ValueError(f"Downloaded file is not a valid Excel file (content-type was: {content_type})")
-
-        # Save downloaded content to correct location
-        with open(FILENAME, "wb") as f:
-            f.write(response.content)
-
-        read_path = FILENAME    # Use the new downloaded file as the data source
+        result = download_file(URL, FILENAME, headers=headers, expected_content_type=EXCEL_CONTENT_TYPE,
+                               progress=progress, should_cancel=should_cancel)
+        return FILENAME, result     # Use the downloaded (or unchanged) file as the data source
 
+    except DownloadCancelled:
+        raise   # Cancelling is not a failure, don't fall back to the backup
     except Exception as e:
         # Use backup if fetch or validation fails
         if os.path.exists(BACKUP_FILENAME):
-            read_path = BACKUP_FILENAME
-        else:
-            # If neither the fetch nor backup worked, raise error
-            raise RuntimeError(f"Failed to fetch Alko data and no backup available:\n{e}")
+            return BACKUP_FILENAME, None
+        # If neither the fetch nor backup worked, raise error
+        raise RuntimeError(f"Failed to fetch Alko data and no backup available:\n{e}")
 
-    # Read the Excel file into a DataFrame, skipping the first 3 header rows (row 3 because of excel format)
-    df = pd.read_excel(read_path, header=3, engine="openpyxl")
 
+def load_price_list(read_path):
+    """
+    Returns the cleaned DataFrame for the given workbook.
+    Uses the binary cache when the workbook content and processing version are unchanged,
+    otherwise processes the workbook and refreshes the cache.
+
+    Returns:
+    - The cleaned DataFrame
+    - The workbook's content hash
+    """
+    df, source_hash = load_cached_price_list(read_path)
+    if df is None:
+        df = clean_price_list(read_price_list(read_path))
+        store_cached_price_list(df, source_hash)
+    return df, source_hash
+
+
+def load_cached_price_list(read_path):
+    """
+    Returns:
+    - The cached DataFrame for the workbook, or None on a cache miss
+    - The workbook's content hash (needed to store the cache afterwards)
+    """
+    source_hash = file_digest(read_path)
+    return load_cached_frame(CACHE_DIR, source_hash), source_hash
+
+
+def store_cached_price_list(df, source_hash):
+    """Writes the cleaned DataFrame to the cache."""
+    try:
+        save_cached_frame(df, CACHE_DIR, source_hash)
+    except OSError:
+        pass    # Caching is only an optimization, a failed write must not break the fetch
+
+
+def record_price_history(df, source_hash):
+    """Saves the processed price list as a snapshot in the local price history database."""
+    try:
+        PriceHistory(HISTORY_DB).record_snapshot(df, source_hash)
+    except sqlite3.Error:
+        pass    # History is a nice-to-have, a locked or broken database must not break the fetch
+
+
+def load_price_changes(df, source_hash):
+    """
+    Compares the processed price list with the previous price list stored in the price history.
+
+    Returns:
+    - PriceListDiff (see data/snapshot_diff.py), or None if there is no earlier snapshot to compare against
+    """
+    try:
+        previous = PriceHistory(HISTORY_DB).load_previous_snapshot(source_hash)
+    except sqlite3.Error:
+        return None
+    if previous is None:
+        return None
+    return diff_price_lists(previous, df)
+
+
+def read_price_list(read_path, should_cancel=None):
+    """
+    Reads the raw price list workbook into a DataFrame.
+    Only the columns used by clean_price_list are read (see data/xlsx_reader.py).
+    Returns None if `should_cancel` requested a stop while reading.
+    """
+    # Column names are on row 4 of the Excel file (the first 3 rows are a title and notes)
+    return read_columns(read_path, text_columns=PRICE_LIST_TEXT_COLUMNS,
+                        numeric_columns=PRICE_LIST_NUMERIC_COLUMNS, header_row=4, should_cancel=should_cancel)
+
+
+def clean_price_list(df, compact=True):
+    """
+    Cleans the raw price list and computes the alcohol-per-euro value for each product.
+    With `compact` (the default) the result is converted to the compact representation, see compact_price_list.
+    """
     # Rename columns for clarity and consistency
     df = df.rename(columns={
         "Nimi": "Tuotenimi",
@@ -94,14 +193,15 @@ def fetch_and_process_data():
         "Tyyppi": "Tyyppi"
     })
 
-    # Drop rows with missing essential values
-    df = df[["Tuotenimi", "Hinta", "Alkoholi%", "Pullokoko", "Tyyppi"]].dropna()
+    # Drop rows with missing essential values ("Numero" is Alko's product number, used as a stable product key)
+    df = df[["Numero", "Tuotenimi", "Hinta", "Alkoholi%", "Pullokoko", "Tyyppi"]].dropna()
+    df["Numero"] = df["Numero"].astype(str).str.strip()
 
     # Normalize "tyyppi" field to lowercase & strip
     df["Tyyppi"] = df["Tyyppi"].astype(str).str.strip().str.lower()
 
     # Remove exact duplicate rows to avoid redundancy eg. same product appearing twice
-    df = df.drop_duplicates()
+    df = df.drop_duplicates(subset=["Tuotenimi", "Hinta", "Alkoholi%", "Pullokoko", "Tyyppi"])
 
     # Convert "Pullokoko" string (e.g., "0.75 l") to float (liters)
     df["Pullokoko (l)"] = df["Pullokoko"].astype(str).str.replace(" l", "", regex=False)
@@ -124,4 +224,33 @@ def fetch_and_process_data():
     df = df.sort_values(by="AlcoholPerEuro", ascending=False)
 
     # Reset the index
-    return df.reset_index(drop=True), (read_path == BACKUP_FILENAME)
+    df = df.reset_index(drop=True)
+    return compact_price_list(df) if compact else df
+
+
+def compact_price_list(df):
+    """
+    Converts the cleaned price list to a compact in-memory representation:
+    - "Tyyppi" becomes categorical (one small integer code per product instead of a string)
+    - Numeric columns become float32
+    - The raw "Pullokoko" string and the intermediate "PureAlcohol_l" column are dropped
+      (both are fully described by the remaining columns)
+    """
+    df = df.drop(columns=["Pullokoko", "PureAlcohol_l"])
+    return df.astype({
+        "Tyyppi": "category",
+        "Hinta": "float32",
+        "Alkoholi%": "float32",
+        "Pullokoko (l)": "float32",
+        "AlcoholPerEuro": "float32",
+    })
+
+
+def category_mask(df, substring):
+    """
+    Boolean mask of products whose "Tyyppi" contains `substring` (case-insensitive).
+    The substring test runs once per category, products are then matched on their category codes.
+    """
+    categories = df["Tyyppi"].cat.categories
+    matching_codes = np.flatnonzero(categories.str.contains(substring, case=False, regex=False))
+    return np.isin(df["Tyyppi"].cat.codes.to_numpy(), matching_codes)
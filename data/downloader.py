@@ -0,0 +1,149 @@
+"""
+downloader.py
+
+Conditional, resumable HTTP download of a single file.
+- Sends If-None-Match / If-Modified-Since so an unchanged file is never downloaded again
+- Streams the body in chunks to "<dest>.part" and renames it into place atomically once complete
+- Resumes an interrupted ".part" file with a Range request (guarded by If-Range)
+
+Validators (ETag / Last-Modified) are kept in a small JSON sidecar file "<dest>.meta.json".
+"""
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+import requests
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadCancelled(Exception):
+    """Raised when a download is cancelled via `should_cancel`. The partial file is kept for resuming."""
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a single download_file() call."""
+    status: str             # "downloaded", "resumed" or "not_modified"
+    bytes_downloaded: int   # Bytes received over the network for this call
+    bytes_saved: int        # Bytes not transferred thanks to 304 responses or resuming
+    elapsed: float          # Wall-clock seconds spent on the fetch
+
+    def summary(self) -> str:
+        return (f"{self.status.replace('_', ' ')}: {self.bytes_downloaded / 1e6:.2f} MB downloaded, "
+                f"{self.bytes_saved / 1e6:.2f} MB saved in {self.elapsed:.2f} s")
+
+
+def _meta_path(dest: str) -> str:
+    return dest + ".meta.json"
+
+
+def _read_meta(dest: str) -> dict:
+    try:
+        with open(_meta_path(dest), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(dest: str, meta: dict):
+    tmp_path = _meta_path(dest) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, _meta_path(dest))
+
+
+def _validators(response) -> dict:
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+
+def download_file(url: str, dest: str, headers: dict | None = None, expected_content_type: str | None = None,
+                  chunk_size: int = CHUNK_SIZE, timeout: float = 30,
+                  progress=None, should_cancel=None) -> DownloadResult:
+    """
+    Download `url` to `dest`, skipping the transfer if the server reports the file unchanged.
+    - progress(done_bytes, total_bytes) is called after every chunk (total is 0 if unknown)
+    - should_cancel() is polled after every chunk; returning True aborts with DownloadCancelled
+
+    Raises:
+    - requests.RequestException on network/HTTP errors (a partial file is kept for resuming)
+    - ValueError if the response content-type does not contain `expected_content_type`
+    """
+    start = time.perf_counter()
+    meta = _read_meta(dest)
+    part_path = dest + ".part"
+
+    request_headers = dict(headers or {})
+    request_headers["Accept-Encoding"] = "identity"     # Byte ranges must refer to the raw file
+
+    # Conditional request: only valid if we still have the file the validators belong to
+    if os.path.exists(dest):
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    # Resume request: continue a previous partial download if we know which version it belongs to
+    resume_from = 0
+    partial = meta.get("partial") or {}
+    etag = partial.get("etag")
+    if_range = etag if etag and not etag.startswith("W/") else partial.get("last_modified")
+    if os.path.exists(part_path) and if_range:
+        resume_from = os.path.getsize(part_path)
+        if resume_from:
+            request_headers["Range"] = f"bytes={resume_from}-"
+            request_headers["If-Range"] = if_range
+
+    with requests.get(url, headers=request_headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 304:
+            result = DownloadResult("not_modified", 0, os.path.getsize(dest), time.perf_counter() - start)
+            logger.info("%s %s", url, result.summary())
+            return result
+
+        if response.status_code == 416:
+            # Our partial file doesn't fit the remote file anymore -> start over
+            os.remove(part_path)
+            meta.pop("partial", None)
+            _write_meta(dest, meta)
+            return download_file(url, dest, headers, expected_content_type, chunk_size, timeout,
+                                 progress, should_cancel)
+
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "")
+        if expected_content_type and expected_content_type not in content_type:
+            raise ValueError(f"Unexpected content-type {content_type!r} (expected {expected_content_type!r})")
+
+        resumed = response.status_code == 206
+        if not resumed:
+            resume_from = 0     # Server sent the whole file (new version or Range unsupported)
+
+        # Remember which version the partial file belongs to before writing any bytes
+        meta["partial"] = _validators(response)
+        _write_meta(dest, meta)
+
+        total = int(response.headers.get("Content-Length", 0) or 0)
+        total = total + resume_from if total else 0
+        downloaded = 0
+        with open(part_path, "ab" if resumed else "wb") as f:
+            for chunk in response.iter_content(chunk_size):
+                f.write(chunk)
+                downloaded += len(chunk)
+                if progress is not None:
+                    progress(resume_from + downloaded, total)
+                if should_cancel is not None and should_cancel():
+                    raise DownloadCancelled(url)
+
+    os.replace(part_path, dest)     # Atomic swap: readers never see a half-written file
+    _write_meta(dest, {**_validators(response), "size": os.path.getsize(dest)})
+
+    result = DownloadResult("resumed" if resumed else "downloaded", downloaded, resume_from,
+                            time.perf_counter() - start)
+    logger.info("%s %s", url, result.summary())
+    return result
@@ -0,0 +1,126 @@
+"""
+ingredient_index.py
+
+Bitset index of the cocktail recipes' normalized ingredients, for the cocktail window's filters.
+Every ingredient gets an id (its position in the sorted vocabulary) and every recipe a bitmask of its ingredient ids,
+stored as uint64 words and built from the recipes' id lists (CSR form, see data/cocktails.py).
+The words are kept word-major (one contiguous array per 64 ingredients, over all recipes), so a filter is
+a handful of vectorized bitwise ops over the recipes instead of a Python loop per recipe:
+- contains all checked ingredients:  recipe & query == query
+- makeable from the shelf:           recipe & ~shelf == 0
+"Almost makeable" recipes (missing at most k ingredients) are ranked by the number of missing ingredients,
+computed as the recipe/ingredient incidence matrix times the "not on the shelf" vector.
+"""
+import numpy as np
+
+WORD_BITS = 64
+
+
+class IngredientIndex:
+    def __init__(self, ingredients, recipe_ids, indptr, families=None):
+        """
+        ingredients: vocabulary of normalized ingredient names, sorted (id = position)
+        recipe_ids, indptr: ingredient ids of every recipe in CSR form, recipe r has recipe_ids[indptr[r]:indptr[r + 1]]
+        families: ingredient family (FAMILY_OF group) of each vocabulary entry, if known
+        """
+        self.ingredients = list(ingredients)
+        self.families = None if families is None else list(families)
+        self.ids = {ing: i for i, ing in enumerate(self.ingredients)}
+        self.recipe_ids = np.asarray(recipe_ids, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self._n = len(self.indptr) - 1
+        words = max(1, -(-len(self.ingredients) // WORD_BITS))
+
+        # (recipe, ingredient id) pairs -> set bit (id % 64) of word (id // 64) of the recipe
+        recipes = np.repeat(np.arange(self._n), np.diff(self.indptr))
+        ids = self.recipe_ids
+        self._bits = np.zeros((words, self._n), dtype=np.uint64)
+        bits = np.left_shift(np.uint64(1), (ids % WORD_BITS).astype(np.uint64))
+        np.bitwise_or.at(self._bits, (ids // WORD_BITS, recipes), bits)
+
+        # Incidence matrix (recipe x ingredient, 1 per distinct pair) as sorted pair keys recipe * V + id,
+        # for counting missing ingredients as a sparse matrix x shelf vector product
+        vocabulary = max(1, len(self.ingredients))
+        keys = np.sort(recipes * vocabulary + ids)
+        keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+        self._pair_recipes, self._pair_ids = keys // vocabulary, keys % vocabulary
+        self._pair_indptr = np.searchsorted(self._pair_recipes, np.arange(self._n + 1))
+
+    @classmethod
+    def from_lists(cls, ingredient_lists):
+        """Index of per-recipe lists of normalized ingredients."""
+        ingredient_lists = list(ingredient_lists)
+        ingredients = sorted({ing for ings in ingredient_lists for ing in ings})
+        ids = {ing: i for i, ing in enumerate(ingredients)}
+        lengths = [len(ings) for ings in ingredient_lists]
+        recipe_ids = np.fromiter((ids[ing] for ings in ingredient_lists for ing in ings), dtype=np.int64,
+                                 count=sum(lengths))
+        return cls(ingredients, recipe_ids, np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]))
+
+    def __len__(self):
+        return self._n
+
+    def mask(self, ingredients) -> np.ndarray:
+        """Bitmask (one uint64 per word) of the given ingredients; ingredients not in any recipe are ignored."""
+        query = np.zeros(len(self._bits), dtype=np.uint64)
+        for ing in ingredients:
+            i = self.ids.get(ing)
+            if i is not None:
+                query[i // WORD_BITS] |= np.uint64(1) << np.uint64(i % WORD_BITS)
+        return query
+
+    def containing_all(self, ingredients) -> np.ndarray:
+        """Boolean mask of the recipes that contain every one of `ingredients`."""
+        ingredients = set(ingredients)
+        if any(ing not in self.ids for ing in ingredients):
+            return np.zeros(self._n, dtype=bool)    # No recipe has it
+        query = self.mask(ingredients)
+        found = np.ones(self._n, dtype=bool)
+        for word in np.flatnonzero(query):
+            found &= (self._bits[word] & query[word]) == query[word]
+        return found
+
+    def makeable(self, shelf) -> np.ndarray:
+        """Boolean mask of the recipes whose ingredients are all in `shelf`."""
+        missing = ~self.mask(shelf)
+        lacking = np.zeros(self._n, dtype=np.uint64)
+        for word in range(len(self._bits)):
+            lacking |= self._bits[word] & missing[word]
+        return lacking == 0
+
+    def lacking(self, shelf) -> np.ndarray:
+        """Bitmask of the ingredients each recipe needs beyond `shelf` (uint64, shape (words, recipes))."""
+        return self._bits & ~self.mask(shelf)[:, None]
+
+    def _not_on_shelf(self, shelf) -> np.ndarray:
+        # 1 for every vocabulary ingredient that is not in `shelf`
+        lacking = np.ones(len(self.ingredients), dtype=np.int64)
+        lacking[[self.ids[ing] for ing in shelf if ing in self.ids]] = 0
+        return lacking
+
+    def missing_counts(self, shelf) -> np.ndarray:
+        """Number of distinct ingredients of each recipe that are not in `shelf`."""
+        lacking = self._not_on_shelf(shelf)
+        return np.bincount(self._pair_recipes, weights=lacking[self._pair_ids], minlength=self._n).astype(np.int64)
+
+    def almost_makeable(self, shelf, max_missing: int):
+        """
+        Recipes missing at most `max_missing` of their ingredients from `shelf`, fewest missing first
+        (ties in recipe order).
+
+        Returns:
+        - Row positions of the recipes, and how many ingredients each of them is missing
+        """
+        counts = self.missing_counts(shelf)
+        rows = np.flatnonzero(counts <= max_missing)
+        rows = rows[np.argsort(counts[rows], kind="stable")]
+        return rows, counts[rows]
+
+    def missing_ingredients(self, rows, shelf) -> list[list[str]]:
+        """The ingredients not in `shelf` of each of the given recipes (vocabulary order)."""
+        lacking = self._not_on_shelf(shelf).astype(bool)
+        out = []
+        for row in rows:
+            ids = self._pair_ids[self._pair_indptr[row]:self._pair_indptr[row + 1]]
+            out.append([self.ingredients[i] for i in ids[lacking[ids]]])
+        return out
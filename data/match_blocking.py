@@ -0,0 +1,69 @@
+"""
+match_blocking.py
+
+Token blocking for fuzzy rating matching against large rating sets.
+Instead of scoring every Alko name against every ratings entry (N x M), each name is only scored against
+the entries that share one of its selective tokens (distillery/brand words, ages, rare words).
+Very common tokens ("whisky", "single", "malt") would put most of the set in one block, so they are skipped,
+except that a name always keeps its MIN_BLOCKING_TOKENS rarest tokens (e.g. a popular distillery name).
+
+Blocking can miss a match whose tokens are all misspelled, so recall() measures it against the exhaustive matcher.
+"""
+from collections import defaultdict
+import numpy as np
+from rapidfuzz import process, fuzz
+
+# Tokens shared by more than this fraction of the entries (and more than MIN_BLOCK_LIMIT entries) don't block
+MAX_BLOCK_FRACTION = 0.02
+MIN_BLOCK_LIMIT = 50
+# Number of rarest tokens of a name that block even if they are common
+MIN_BLOCKING_TOKENS = 2
+
+
+class TokenBlockingIndex:
+    def __init__(self, choices, max_block_fraction: float = MAX_BLOCK_FRACTION):
+        """choices: normalized ratings names (same cleaning as the names that will be looked up)."""
+        postings = defaultdict(list)
+        for position, choice in enumerate(choices):
+            for token in set(choice.split()):
+                postings[token].append(position)
+        self._postings = {token: np.array(rows, dtype=np.int64) for token, rows in postings.items()}
+        self._limit = max(MIN_BLOCK_LIMIT, int(len(choices) * max_block_fraction))
+
+    def candidates(self, name: str) -> np.ndarray:
+        """Positions (ascending) of the entries sharing a selective token with `name`."""
+        blocks = sorted((self._postings[token] for token in set(name.split()) if token in self._postings), key=len)
+        if not blocks:
+            return np.zeros(0, dtype=np.int64)
+        selective = [
+            block for rank, block in enumerate(blocks) if rank < MIN_BLOCKING_TOKENS or len(block) <= self._limit
+        ]
+        return np.unique(np.concatenate(selective))
+
+
+def blocked_best_matches(names, choices, threshold: float, index=None) -> np.ndarray:
+    """
+    Same result format as ratings.best_matches (position of the best match or -1), but each name is only
+    scored against its blocking candidates. Ties go to the first candidate, as with process.extractOne.
+    """
+    choices = list(choices)
+    index = index if index is not None else TokenBlockingIndex(choices)
+    best = np.full(len(names), -1, dtype=np.int64)
+    for i, name in enumerate(names):
+        candidates = index.candidates(name)
+        if not len(candidates):
+            continue
+        match = process.extractOne(
+            name, [choices[j] for j in candidates], scorer=fuzz.token_sort_ratio, score_cutoff=threshold
+        )
+        if match:
+            best[i] = candidates[match[2]]
+    return best
+
+
+def recall(blocked: np.ndarray, exhaustive: np.ndarray) -> float:
+    """Share of the exhaustive matcher's matches that blocking found too (1.0 if there were none)."""
+    matched = exhaustive >= 0
+    if not matched.any():
+        return 1.0
+    return float((blocked[matched] == exhaustive[matched]).mean())
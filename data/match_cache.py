@@ -0,0 +1,42 @@
+"""
+match_cache.py
+
+Disk cache of fuzzy rating matches: normalized Alko product name -> row position in the ratings workbook
+(-1 for no match). One small JSON file per matcher, tagged with a key derived from the ratings workbook's
+content hash and the matching parameters, so reopening a rating window only matches products it hasn't seen.
+A file with another key (different workbook, threshold, scorer or normalizer) is ignored and replaced.
+"""
+import hashlib
+import json
+import os
+from data.price_cache import file_digest
+
+# Bump this whenever the way positions are computed changes without a parameter change
+MATCH_CACHE_VERSION = 1
+
+
+def match_key(ratings_path: str, *params) -> str:
+    """Cache key for matches against `ratings_path` made with the given parameters (scorer, threshold, ...)."""
+    parts = [file_digest(ratings_path), str(MATCH_CACHE_VERSION)] + [str(param) for param in params]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_matches(path: str, key: str) -> dict:
+    """Cached {name: position} matches made with `key`, or an empty dict if missing, stale or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return {}
+    return cached.get("matches", {})
+
+
+def save_matches(path: str, key: str, matches: dict):
+    """Write the matches atomically (temporary file + rename), so an interrupted write can't corrupt the cache."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "matches": matches}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
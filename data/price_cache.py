@@ -0,0 +1,91 @@
+"""
+price_cache.py
+
+Binary columnar cache for the processed Alko price list.
+Each column of the cleaned DataFrame is stored as its own typed numpy array inside a single .npz file,
+so an unchanged workbook can be loaded back in milliseconds instead of re-parsing the Excel file.
+"""
+import hashlib
+import os
+import numpy as np
+import pandas as pd
+
+# Bump this whenever the cleaning steps in data_handler change the resulting DataFrame.
+# A cache written with another version is ignored and rebuilt automatically.
+PROCESSING_VERSION = 3
+
+# Name of the cache file inside the cache directory (only the latest price list is kept)
+CACHE_FILENAME = "processed_price_list.npz"
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cached_frame(cache_dir: str, source_hash: str, version: int = PROCESSING_VERSION):
+    """
+    Load the cached DataFrame if it was built from the same workbook (hash) with the same processing version.
+
+    Returns:
+    - The cached DataFrame, or None if the cache is missing, stale or unreadable
+    """
+    path = os.path.join(cache_dir, CACHE_FILENAME)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            cached_hash, cached_version = archive["__meta__"].tolist()
+            if cached_hash != source_hash or int(cached_version) != version:
+                return None     # Workbook or cleaning logic changed -> rebuild
+
+            columns = {}
+            for i, (name, kind) in enumerate(zip(archive["__columns__"].tolist(), archive["__kinds__"].tolist())):
+                if kind == "category":
+                    columns[name] = pd.Categorical.from_codes(
+                        archive[f"col{i}_codes"], categories=archive[f"col{i}_categories"]
+                    )
+                else:
+                    columns[name] = archive[f"col{i}"]
+    except (OSError, KeyError, ValueError):
+        return None     # Corrupt or old-format cache is treated as a miss
+
+    return pd.DataFrame(columns)
+
+
+def save_cached_frame(df: pd.DataFrame, cache_dir: str, source_hash: str, version: int = PROCESSING_VERSION):
+    """
+    Write the DataFrame to the cache as one typed array per column.
+    The file is written to a temporary name first and then renamed, so a crash never leaves a half-written cache.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    arrays = {}
+    kinds = []
+    for i, name in enumerate(df.columns):
+        series = df[name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            kinds.append("category")
+            arrays[f"col{i}_codes"] = series.cat.codes.to_numpy()
+            arrays[f"col{i}_categories"] = np.asarray(series.cat.categories, dtype=str)
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            kinds.append("numeric")
+            arrays[f"col{i}"] = series.to_numpy()
+        else:
+            kinds.append("text")    # Strings are stored as fixed-width unicode, so no pickling is needed
+            arrays[f"col{i}"] = np.asarray(series.astype(str), dtype=str)
+
+    arrays["__columns__"] = np.asarray(df.columns, dtype=str)
+    arrays["__kinds__"] = np.asarray(kinds, dtype=str)
+    arrays["__meta__"] = np.asarray([source_hash, str(version)], dtype=str)
+
+    path = os.path.join(cache_dir, CACHE_FILENAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
@@ -0,0 +1,161 @@
+"""
+price_history.py
+
+Local SQLite store of every fetched price list snapshot.
+- snapshots: one row per fetch (time + content hash of the workbook)
+- prices:    one row per product per snapshot, keyed on (snapshot_id, product_key)
+- products:  latest name and category for each product key (Alko's "Numero")
+
+Snapshot ids increase with time, so the (product_key, snapshot_id) index gives a product's time series
+in date order, and comparing two dates only touches the rows of two snapshots no matter how long the
+history grows.
+"""
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+import pandas as pd
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id          INTEGER PRIMARY KEY,
+    fetched_at  TEXT NOT NULL,
+    source_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_fetched_at ON snapshots(fetched_at);
+
+CREATE TABLE IF NOT EXISTS products (
+    product_key TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    category    TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS prices (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+    product_key TEXT NOT NULL,
+    price       REAL NOT NULL,
+    abv         REAL NOT NULL,
+    size_l      REAL NOT NULL,
+    PRIMARY KEY (snapshot_id, product_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_prices_product ON prices(product_key, snapshot_id);
+"""
+
+
+class PriceHistory:
+    """Read/write access to the price history database at `db_path`."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # A short-lived connection per call, so the store can be used from the fetch worker and the GUI thread
+        return sqlite3.connect(self.db_path)
+
+    def record_snapshot(self, df: pd.DataFrame, source_hash: str, fetched_at: datetime | None = None):
+        """
+        Save a processed price list (output of fetch_and_process_data) as a new snapshot.
+        Nothing is written if the workbook is identical to the latest snapshot, since it holds no new prices.
+
+        Returns:
+        - The new snapshot id, or None if the snapshot was skipped
+        """
+        fetched_at = (fetched_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+
+        with closing(self._connect()) as conn, conn:
+            latest = conn.execute("SELECT source_hash FROM snapshots ORDER BY id DESC LIMIT 1").fetchone()
+            if latest is not None and latest[0] == source_hash:
+                return None
+
+            snapshot_id = conn.execute(
+                "INSERT INTO snapshots (fetched_at, source_hash) VALUES (?, ?)", (fetched_at, source_hash)
+            ).lastrowid
+
+            keys = df["Numero"].astype(str).tolist()
+            conn.executemany(
+                "INSERT INTO products (product_key, name, category) VALUES (?, ?, ?) "
+                "ON CONFLICT(product_key) DO UPDATE SET name = excluded.name, category = excluded.category",
+                zip(keys, df["Tuotenimi"].astype(str).tolist(), df["Tyyppi"].astype(str).tolist()),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO prices (snapshot_id, product_key, price, abv, size_l) VALUES (?, ?, ?, ?, ?)",
+                # Rounded so the float32 columns of the price list are stored as exact cents/percent/liters
+                zip([snapshot_id] * len(keys), keys,
+                    df["Hinta"].astype(float).round(2).tolist(),
+                    df["Alkoholi%"].astype(float).round(2).tolist(),
+                    df["Pullokoko (l)"].astype(float).round(3).tolist()),
+            )
+        return snapshot_id
+
+    def load_previous_snapshot(self, source_hash: str):
+        """
+        Load the most recent snapshot of a different workbook than `source_hash` (i.e. the previous price list).
+
+        Returns:
+        - DataFrame with the processed price list columns used for diffing
+          (Numero, Tuotenimi, Tyyppi, Hinta, Alkoholi%, Pullokoko (l)), or None if there is no such snapshot
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT id FROM snapshots WHERE source_hash != ? ORDER BY id DESC LIMIT 1", (source_hash,)
+            ).fetchone()
+            if row is None:
+                return None
+            return pd.read_sql_query(
+                'SELECT p.product_key AS "Numero", pr.name AS "Tuotenimi", pr.category AS "Tyyppi", '
+                'p.price AS "Hinta", p.abv AS "Alkoholi%", p.size_l AS "Pullokoko (l)" '
+                "FROM prices p JOIN products pr ON pr.product_key = p.product_key "
+                "WHERE p.snapshot_id = ?",
+                conn, params=(row[0],),
+            )
+
+    def search_products(self, term: str, limit: int = 50) -> pd.DataFrame:
+        """Products whose name contains `term` (case-insensitive): product_key, name, category."""
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                "SELECT product_key, name, category FROM products WHERE name LIKE ? ORDER BY name LIMIT ?",
+                conn, params=(f"%{term}%", limit),
+            )
+
+    def price_trend(self, product_key: str) -> pd.DataFrame:
+        """Price time series of one product: fetched_at, price, abv, size_l (oldest first)."""
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                "SELECT s.fetched_at, p.price, p.abv, p.size_l "
+                "FROM prices p JOIN snapshots s ON s.id = p.snapshot_id "
+                "WHERE p.product_key = ? ORDER BY p.snapshot_id",
+                conn, params=(str(product_key),),
+            )
+
+    def biggest_price_drops(self, since: datetime, limit: int = 20, category: str | None = None) -> pd.DataFrame:
+        """
+        Compare the latest snapshot with the price list as it was at `since`.
+        The baseline is the last snapshot taken at or before `since` (or the oldest one if none is that old).
+
+        Returns:
+        - product_key, name, category, old_price, new_price, change, change_pct (largest drop first)
+        """
+        since = since.strftime("%Y-%m-%d %H:%M:%S")
+        with closing(self._connect()) as conn:
+            latest = conn.execute("SELECT MAX(id) FROM snapshots").fetchone()[0]
+            baseline = conn.execute(
+                "SELECT COALESCE((SELECT MAX(id) FROM snapshots WHERE fetched_at <= ?), MIN(id)) FROM snapshots",
+                (since,),
+            ).fetchone()[0]
+
+            query = (
+                "SELECT new.product_key, pr.name, pr.category, old.price AS old_price, new.price AS new_price, "
+                "new.price - old.price AS change, (new.price - old.price) / old.price * 100 AS change_pct "
+                "FROM prices new "
+                "JOIN prices old ON old.snapshot_id = ? AND old.product_key = new.product_key "
+                "JOIN products pr ON pr.product_key = new.product_key "
+                "WHERE new.snapshot_id = ? AND new.price < old.price"
+            )
+            params = [baseline, latest]
+            if category is not None:
+                query += " AND pr.category = ?"
+                params.append(category)
+            query += " ORDER BY change_pct ASC LIMIT ?"
+            params.append(limit)
+            return pd.read_sql_query(query, conn, params=params)
@@ -0,0 +1,153 @@
+"""
+purchase_optimizer.py
+
+Which Alko bottles to buy next: picks up to N bottles within a budget so that the most new cocktails become makeable.
+- Every normalized ingredient sold at Alko (ALKO_PRODUCTS in utils/ingredients_mapper.py) is mapped to the matching
+  standard-size bottle with the lowest price per litre once per price list (cheapest_products),
+  and the optimizer keeps that mapping
+- The choice is a greedy weighted set cover over the recipes' ingredient bitsets (data/ingredient_index.py).
+  The candidates are the distinct sets of bottles that recipes still lack (one bottle, or e.g. the two bottles
+  that only complete a cocktail together); each step buys the set that unlocks the most recipes per euro
+  and still fits the remaining budget and bottle count
+Ingredients that aren't sold at Alko (juices, syrups, fruit, garnishes, ...) count as available from a grocery store.
+"""
+from dataclasses import dataclass
+import numpy as np
+from data.data_handler import category_mask
+from data.ingredient_index import WORD_BITS
+from utils.ingredients_mapper import ALKO_PRODUCTS, ALKO_MIN_ALCOHOL, ALKO_EXCLUDED
+
+# Bottle sizes suggested: a standard bottle (0.5-1 l) when the product comes in one, otherwise
+# (e.g. bitters) the smaller bottles down to MIN_BOTTLE_L; miniatures, boxes and kegs are never suggested
+STANDARD_BOTTLE_L = (0.5, 1.0)
+MIN_BOTTLE_L = 0.1
+# Largest set of bottles bought in one greedy step (recipes lacking more are only completed over several steps);
+# the gain of a bundle in suggest() assumes bundles of one or two bottles
+MAX_BUNDLE_BOTTLES = 2
+
+
+@dataclass(frozen=True)
+class BottlePick:
+    """One suggested bottle."""
+    ingredient: str     # Normalized ingredient it provides
+    product: str        # Alko product name ("Tuotenimi")
+    number: str         # Alko product number ("Numero")
+    price: float
+    unlocked: tuple     # Recipe positions that become makeable once this bottle (and the earlier ones) is bought
+
+
+def cheapest_products(alko_df, category_index=None) -> dict:
+    """
+    Product of each ALKO_PRODUCTS ingredient that Alko currently sells, cheapest per litre
+    among the standard bottles (or the small bottles if it isn't sold in a standard one).
+
+    Returns:
+    - {ingredient: position of the product in alko_df}
+    """
+    sizes = alko_df["Pullokoko (l)"].to_numpy()
+    prices = alko_df["Hinta"].to_numpy()
+    alcohol = alko_df["Alkoholi%"].to_numpy()
+    names = alko_df["Tuotenimi"]
+    category_rows = {}  # Many ingredients share a category: look each one up once
+    products = {}
+    for ingredient, (category, pattern) in ALKO_PRODUCTS.items():
+        if category not in category_rows:
+            rows = (category_index.matching(category) if category_index is not None
+                    else np.flatnonzero(category_mask(alko_df, category)))
+            rows = rows[(sizes[rows] >= MIN_BOTTLE_L) & (sizes[rows] <= STANDARD_BOTTLE_L[1])]
+            category_rows[category] = rows[~names.iloc[rows].str.contains(ALKO_EXCLUDED, case=False).to_numpy()]
+        rows = category_rows[category]
+        if pattern is not None and len(rows):
+            rows = rows[names.iloc[rows].str.contains(pattern, case=False, regex=True).to_numpy()]
+        if ingredient in ALKO_MIN_ALCOHOL:
+            rows = rows[alcohol[rows] >= ALKO_MIN_ALCOHOL[ingredient]]
+        standard = rows[sizes[rows] >= STANDARD_BOTTLE_L[0]]
+        rows = standard if len(standard) else rows
+        if len(rows):
+            products[ingredient] = int(rows[np.argmin(prices[rows] / sizes[rows])])
+    return products
+
+
+class BottleOptimizer:
+    def __init__(self, alko_df, ingredient_index, category_index=None):
+        """
+        alko_df: processed price list (output of fetch_and_process_data)
+        ingredient_index: IngredientIndex of the cocktail recipes
+        category_index: CategoryIndex of alko_df (optional, speeds up the product lookup)
+        """
+        self.alko_df = alko_df
+        self.index = ingredient_index
+        self.products = cheapest_products(alko_df, category_index)  # Cached for this price list
+
+        vocabulary = ingredient_index.ingredients
+        prices = alko_df["Hinta"].to_numpy()
+        self._product_rows = np.array([self.products.get(ing, -1) for ing in vocabulary], dtype=np.int64)
+        self._prices = np.where(self._product_rows >= 0, prices[self._product_rows], np.inf)
+        # Non-Alko ingredients come from the grocery store; Alko ingredients without a product can't be bought
+        self._groceries = [ing for ing in vocabulary if ing not in ALKO_PRODUCTS]
+        self._unavailable = ingredient_index.mask(
+            [ing for ing in vocabulary if ing in ALKO_PRODUCTS and ing not in self.products]
+        )
+
+    def _groups(self, lacking):
+        # Distinct columns of `lacking` (shape (words, recipes)) as rows, with how many recipes share each
+        order = np.lexsort(lacking)
+        ordered = lacking[:, order]
+        starts = np.concatenate([[True], np.any(ordered[:, 1:] != ordered[:, :-1], axis=0)])
+        counts = np.diff(np.append(np.flatnonzero(starts), ordered.shape[1]))
+        return ordered[:, starts].T, counts
+
+    def _bundle_ids(self, bundles):
+        # Vocabulary ids set in each bundle bitmask (shape (bundles, words)) as a bool matrix (bundles, ingredients)
+        ids = np.arange(len(self.index.ingredients))
+        words, bits = ids // WORD_BITS, (ids % WORD_BITS).astype(np.uint64)
+        return ((bundles[:, words] >> bits) & np.uint64(1)).astype(bool)
+
+    def suggest(self, shelf, budget: float, max_bottles: int) -> list[BottlePick]:
+        """
+        Bottles to buy (in buying order) so that the most recipes become makeable on top of `shelf`,
+        spending at most `budget` euros on at most `max_bottles` bottles.
+        """
+        have = set(shelf) | set(self._groceries)
+        lacking = self.index.lacking(have)
+        reachable = ~np.any(lacking & self._unavailable[:, None], axis=0)
+        makeable = self.index.makeable(have)
+        picks = []
+
+        while max_bottles > 0:
+            # Recipes that a bundle of at most MAX_BUNDLE_BOTTLES bottles would complete, grouped by what they lack
+            size = self.index.missing_counts(have)
+            candidates = np.flatnonzero(reachable & ~makeable & (size <= min(max_bottles, MAX_BUNDLE_BOTTLES)))
+            if not len(candidates):
+                break
+            groups, counts = self._groups(lacking[:, candidates])
+            in_bundle = self._bundle_ids(groups)
+            costs = in_bundle.astype(np.float64) @ np.where(np.isfinite(self._prices), self._prices, 0.0)
+            affordable = costs <= budget
+            if not affordable.any():
+                break
+
+            # Recipes completed by each bundle: its own group plus, for a two-bottle bundle, the groups
+            # lacking only one of its bottles (the groups lacking a subset of it)
+            bottles = in_bundle.sum(axis=1)
+            single = np.zeros(in_bundle.shape[1], dtype=np.int64)
+            single[np.argmax(in_bundle[bottles == 1], axis=1)] = counts[bottles == 1]
+            gains = counts + np.where(bottles > 1, in_bundle @ single, 0)
+            value = np.where(affordable, gains / costs, -1.0)
+            best = int(np.lexsort((gains, value))[-1])    # Most recipes per euro, then most recipes
+
+            # Buy the bundle's bottles cheapest first, crediting each with the recipes it completes
+            for ingredient_id in sorted(np.flatnonzero(in_bundle[best]), key=lambda i: self._prices[i]):
+                ingredient = self.index.ingredients[ingredient_id]
+                have.add(ingredient)
+                lacking = self.index.lacking(have)
+                now = self.index.makeable(have)
+                row = self._product_rows[ingredient_id]
+                picks.append(BottlePick(
+                    ingredient, self.alko_df["Tuotenimi"].iat[row], str(self.alko_df["Numero"].iat[row]),
+                    float(self._prices[ingredient_id]), tuple(np.flatnonzero(now & ~makeable).tolist()),
+                ))
+                makeable = now
+            budget -= costs[best]
+            max_bottles -= int(in_bundle[best].sum())
+        return picks
@@ -0,0 +1,219 @@
+"""
+ratings.py
+
+Ratings engine: matching of Alko products against community rating datasets (RumHowler / WhiskyScores),
+plus loading of the user's own ratings. Free of any UI code, so it is shared by the rating windows
+and the headless command-line entry point (cli.py).
+
+Each spirit category is described by a RatingSource (category filter, ratings workbook, name normalizer,
+threshold); adding e.g. gin ratings only needs a new entry in RATING_SOURCES.
+Matching can run in a shared worker pool (submit_rate_products) to keep it off the GUI thread.
+"""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable
+import numpy as np
+import pandas as pd
+from rapidfuzz import process, fuzz
+from data.data_handler import ASSETS_DIR, CACHE_DIR, category_mask
+from data.match_cache import match_key, load_matches, save_matches
+from data.match_blocking import blocked_best_matches, MAX_BLOCK_FRACTION, MIN_BLOCKING_TOKENS
+from data.user_store import get_user_store
+
+# Bundled community rating datasets
+RUM_RATINGS_FILE = os.path.join(ASSETS_DIR, "rumhowler_data.xlsx")
+WHISKEY_RATINGS_FILE = os.path.join(ASSETS_DIR, "whiskey_scores_data.xlsx")
+
+# Worker threads for submit_rate_products (rapidfuzz itself also spreads cdist over all cores)
+MAX_MATCH_WORKERS = 2
+_executor = None
+_executor_lock = threading.Lock()
+_cache_locks = {}  # Match cache file -> lock serializing its reads/writes between workers
+
+# Rating sets larger than this are matched with token blocking (data/match_blocking.py) instead of
+# scoring every pair; smaller ones (like the bundled workbooks) use the exact exhaustive match
+BLOCKING_MIN_CHOICES = 20_000
+
+# Price list columns carried over to the rating tables (the rest of the product DataFrame is not copied)
+DISPLAY_COLUMNS = ["Tuotenimi", "Hinta", "Alkoholi%", "Pullokoko (l)", "AlcoholPerEuro"]
+
+
+def load_user_ratings(spirit: str) -> dict:
+    """Returns the user's saved ratings of a RatingSource ({product name: rating}), see data/user_store.py."""
+    return get_user_store().load_ratings(spirit)
+
+
+def add_user_ratings(df: pd.DataFrame, spirit: str) -> pd.DataFrame:
+    """Adds a "MyRating" column with the user's own rating for each product ("" if unrated)."""
+    user_ratings = load_user_ratings(spirit)
+    # object dtype, so ratings can later be set in place even when none are saved yet (all "")
+    df["MyRating"] = df["Tuotenimi"].apply(lambda name: user_ratings.get(name, "")).astype(object)
+    return df
+
+
+def clean_whiskey_names(names: pd.Series) -> pd.Series:
+    """Lowercase, strip punctuation and collapse whitespace (used on both sides of the whiskey match)."""
+    return (
+        names
+        .astype(str)
+        .str.lower()
+        .str.replace(r"[^a-z0-9\s]", "", regex=True)  # remove punctuation
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def normalize_lower_strip(names: pd.Series) -> pd.Series:
+    """Lowercase and strip (used on both sides of the rum match)."""
+    return names.str.lower().str.strip()
+
+
+@dataclass(frozen=True)
+class RatingSource:
+    """Everything the ratings engine needs to rate one spirit category."""
+    name: str                       # Short id, also names the match cache file and the user's ratings ("rum")
+    category: str                   # Substring of the Alko "Tyyppi" categories to rate ("rommi")
+    ratings_path: str               # Community ratings workbook (columns: name, Score, ReviewCount, source)
+    name_column: str                # Product name column of the workbook
+    normalizer: Callable            # Name cleaning, applied to both the Alko and the workbook names
+    threshold: float                # Minimum token_sort_ratio score for a match
+    source_columns: tuple = ("Source",)     # Workbook columns tried in order for the "Source" value
+
+
+RATING_SOURCES = {
+    "rum": RatingSource(
+        "rum", "rommi", RUM_RATINGS_FILE, "Rum", normalize_lower_strip, 90
+    ),
+    "whiskey": RatingSource(
+        "whiskey", "viski", WHISKEY_RATINGS_FILE, "Whiskey", clean_whiskey_names, 85, ("Website", "Source")
+    ),
+}
+
+
+def best_matches(names, choices, threshold: float) -> np.ndarray:
+    """
+    Best token_sort_ratio match of every name among `choices`, scored in one rapidfuzz cdist call on all cores
+    (or via token blocking for rating sets larger than BLOCKING_MIN_CHOICES).
+
+    Returns:
+    - Position in `choices` of each name's best match, or -1 if it scores below `threshold`.
+      Ties go to the first choice, as with process.extractOne.
+    """
+    names = list(names)
+    choices = [choice if isinstance(choice, str) else "" for choice in choices]    # Missing names never match
+    if not names or not choices:
+        return np.full(len(names), -1)
+    if len(choices) > BLOCKING_MIN_CHOICES:
+        return blocked_best_matches(names, choices, threshold)
+    scores = process.cdist(
+        names, choices, scorer=fuzz.token_sort_ratio, score_cutoff=threshold, dtype=np.float64, workers=-1
+    )   # Scores below the cutoff come back as 0
+    best = scores.argmax(axis=1)
+    return np.where(scores[np.arange(len(names)), best] >= threshold, best, -1)
+
+
+def cached_best_matches(names, choices, threshold: float, ratings_path: str, normalizer: str, cache_path=None):
+    """
+    best_matches() with a disk cache keyed on the ratings workbook's hash and the matching parameters:
+    only names missing from the cache are matched, and the cache is updated with them.
+    normalizer: name of the cleaning applied to `names`/`choices` (part of the cache key)
+    cache_path: JSON cache file, or None to always match everything
+    """
+    names = list(names)
+    if cache_path is None:
+        return best_matches(names, choices, threshold)
+
+    choices = list(choices)
+    if len(choices) > BLOCKING_MIN_CHOICES:
+        blocking = f"blocking-{MAX_BLOCK_FRACTION}-{MIN_BLOCKING_TOKENS}"
+    else:
+        blocking = "exhaustive"
+    key = match_key(ratings_path, "token_sort_ratio", threshold, normalizer, blocking)
+    with _cache_locks.setdefault(cache_path, threading.Lock()):
+        matches = load_matches(cache_path, key)
+        new_names = list(dict.fromkeys(name for name in names if name not in matches))     # Unique, in order
+        if new_names:
+            matches.update(zip(new_names, best_matches(new_names, choices, threshold).tolist()))
+            try:
+                save_matches(cache_path, key, matches)
+            except OSError:
+                pass    # Caching is only an optimization, a failed write must not break the matching
+    return np.array([matches[name] for name in names], dtype=np.int64)
+
+
+def select_products(alko_df: pd.DataFrame, category: str, category_index=None) -> pd.DataFrame:
+    """
+    DISPLAY_COLUMNS of the products whose category contains `category` (e.g. "rommi").
+    category_index: CategoryIndex of alko_df (data/search_index.py), if one was already built
+    """
+    if category_index is None:
+        return alko_df.loc[category_mask(alko_df, category), DISPLAY_COLUMNS].copy()
+    return alko_df.iloc[category_index.matching(category)][DISPLAY_COLUMNS].copy()
+
+
+def match_ratings(alko_df: pd.DataFrame, source: RatingSource, category_index=None, cache_dir=CACHE_DIR):
+    """
+    Match the Alko products of one spirit category against its community ratings.
+    category_index: optional CategoryIndex of alko_df, used to find the products
+    cache_dir: directory of the match cache, or None to match every product again
+
+    Returns:
+    - Products with "Rating", "ReviewCount" and "Source" columns (empty for unmatched products),
+      or None if the ratings file is missing
+    """
+    if not os.path.exists(source.ratings_path):
+        return None
+
+    ratings_df = pd.read_excel(source.ratings_path)
+    products_df = select_products(alko_df, source.category, category_index)
+
+    # Match all products at once (same cleaning on both sides), matched rows are recovered by position
+    best = cached_best_matches(
+        source.normalizer(products_df["Tuotenimi"]), source.normalizer(ratings_df[source.name_column]),
+        source.threshold, source.ratings_path, source.normalizer.__name__,
+        os.path.join(cache_dir, f"{source.name}_matches.json") if cache_dir else None
+    )
+    score_col = ratings_df["Score"].to_numpy()
+    count_col = ratings_df["ReviewCount"].to_numpy() if "ReviewCount" in ratings_df.columns else None
+    # First of the source columns that the workbook actually has
+    source_name = next((column for column in source.source_columns if column in ratings_df.columns), None)
+    source_col = ratings_df[source_name].to_numpy() if source_name else None
+
+    products_df["Rating"] = [score_col[i] if i >= 0 else None for i in best]
+    products_df["ReviewCount"] = [count_col[i] if i >= 0 and count_col is not None else None for i in best]
+    products_df["Source"] = [source_col[i] if i >= 0 and source_col is not None else "" for i in best]
+    return products_df
+
+
+def rate_products(alko_df: pd.DataFrame, source: RatingSource, category_index=None, include_user_ratings=True):
+    """match_ratings() plus the user's own ratings in a "MyRating" column (None if the ratings file is missing)."""
+    rated = match_ratings(alko_df, source, category_index)
+    if rated is not None and include_user_ratings:
+        rated = add_user_ratings(rated, source.name)
+    return rated
+
+
+def submit_rate_products(alko_df: pd.DataFrame, source: RatingSource, category_index=None,
+                         include_user_ratings=True) -> Future:
+    """Run rate_products() in the shared worker pool; the caller gets a Future instead of waiting."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_MATCH_WORKERS, thread_name_prefix="ratings")
+    return _executor.submit(rate_products, alko_df, source, category_index, include_user_ratings)
+
+
+def match_rum_ratings(alko_df: pd.DataFrame, ratings_path: str = RUM_RATINGS_FILE, category_index=None,
+                      cache_dir=CACHE_DIR):
+    """Match Alko rums against the RumHowler ratings (see match_ratings)."""
+    return match_ratings(alko_df, replace(RATING_SOURCES["rum"], ratings_path=ratings_path), category_index, cache_dir)
+
+
+def match_whiskey_ratings(alko_df: pd.DataFrame, ratings_path: str = WHISKEY_RATINGS_FILE, category_index=None,
+                          cache_dir=CACHE_DIR):
+    """Match Alko whiskeys against the WhiskyScores ratings (see match_ratings)."""
+    return match_ratings(
+        alko_df, replace(RATING_SOURCES["whiskey"], ratings_path=ratings_path), category_index, cache_dir
+    )
@@ -0,0 +1,134 @@
+"""
+search_index.py
+
+Indexes built once per loaded price list, so filtering doesn't rescan the whole product list.
+
+TrigramIndex: inverted index for case-insensitive substring search over product names.
+- Built once per dataset (vectorized with numpy, no per-name Python loop over trigrams)
+- A query intersects the posting lists of its trigrams, then confirms the few remaining
+  candidates with a plain substring test (trigrams alone don't guarantee order/adjacency)
+- Queries shorter than three characters fall back to a linear scan
+- Used by the main product table and the user rating windows
+
+CategoryIndex: row positions of the products of each "Tyyppi" category.
+- Used by the category dropdown and the rum/whiskey category filters of the rating matchers
+"""
+import numpy as np
+
+NGRAM = 3
+SEPARATOR = "\x00"  # Joins the names while building; trigrams crossing it are dropped
+
+
+class TrigramIndex:
+    def __init__(self, names):
+        self.names = [str(name).lower() for name in names]  # Lowercased names, searched in order
+
+        text = SEPARATOR.join(self.names) + SEPARATOR
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+        # Map the characters that occur to dense ids (0 = separator), so a trigram fits in few bits
+        present = np.zeros(int(codepoints.max()) + 1, dtype=bool)
+        present[codepoints] = True
+        present[0] = False
+        self._char_ids = np.cumsum(present, dtype=np.int64) * present     # codepoint -> id (0 if absent)
+        self._alphabet = int(present.sum()) + 1
+        chars = self._char_ids[codepoints]
+
+        # Name (row) position of every character
+        lengths = np.fromiter((len(name) + 1 for name in self.names), dtype=np.int64, count=len(self.names))
+        rows = np.repeat(np.arange(len(self.names), dtype=np.int64), lengths)
+
+        first, second, third = chars[:-2], chars[1:-1], chars[2:]
+        valid = (first != 0) & (second != 0) & (third != 0)
+        codes = (first * self._alphabet + second) * self._alphabet + third
+
+        # One sort over (trigram, row) pairs gives every posting list in ascending row order
+        shift = max(len(self.names), 1).bit_length()
+        keys = np.sort((codes[valid] << shift) | rows[:-2][valid])
+        keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys    # Trigram repeated in a name
+        grams = keys >> shift
+        self._postings = (keys & ((1 << shift) - 1)).astype(np.int32)
+        starts = np.flatnonzero(np.r_[True, grams[1:] != grams[:-1]]) if len(grams) else np.zeros(0, np.int64)
+        self._grams = grams[starts]
+        self._offsets = np.append(starts, len(grams))
+
+    def __len__(self):
+        return len(self.names)
+
+    def _candidates(self, term: str):
+        """
+        Rows containing every trigram of the (lowercased) term, ascending,
+        or None if the term is too short for the index to narrow anything down.
+        """
+        if len(term) < NGRAM:
+            return None
+        codepoints = np.array([ord(c) for c in term], dtype=np.int64)
+        if codepoints.max() >= len(self._char_ids):
+            return np.zeros(0, dtype=np.int32)
+        chars = self._char_ids[codepoints]
+        if not chars.all():
+            return np.zeros(0, dtype=np.int32)     # A character that no name contains
+
+        codes = np.unique((chars[:-2] * self._alphabet + chars[1:-1]) * self._alphabet + chars[2:])
+        slots = np.searchsorted(self._grams, codes)
+        if (slots >= len(self._grams)).any() or (self._grams[np.minimum(slots, len(self._grams) - 1)] != codes).any():
+            return np.zeros(0, dtype=np.int32)     # A trigram that no name contains
+
+        # Intersect the posting lists, shortest first
+        postings = sorted(
+            (self._postings[self._offsets[slot]:self._offsets[slot + 1]] for slot in slots.tolist()), key=len
+        )
+        result = postings[0]
+        for posting in postings[1:]:
+            if not len(result):
+                break
+            result = result[np.isin(result, posting, assume_unique=True)]
+        return result
+
+    def search(self, term: str, rows=None) -> list:
+        """
+        Positions of the names that contain `term` (case-insensitive), in ascending order.
+        rows: optionally only consider these positions (ascending), e.g. an earlier result or a category.
+        """
+        term = term.lower()
+        if rows is None:
+            rows = range(len(self.names))
+        if not term:
+            return list(rows)
+
+        candidates = self._candidates(term)
+        if candidates is None or len(rows) <= len(candidates):
+            candidates = rows   # Scanning the given rows is no more work than checking the candidates
+        elif not isinstance(rows, range):
+            candidates = np.intersect1d(candidates, rows, assume_unique=True)
+        if isinstance(candidates, np.ndarray):
+            candidates = candidates.tolist()
+
+        names = self.names
+        return [row for row in candidates if term in names[row]]
+
+
+class CategoryIndex:
+    def __init__(self, categories):
+        """categories: the categorical "Tyyppi" column of the product DataFrame."""
+        self.categories = categories.cat.categories.tolist()
+        codes = categories.cat.codes.to_numpy()
+
+        # Stable sort by category code keeps each partition in ascending row order
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.categories))
+        bounds = np.cumsum(counts) + np.count_nonzero(codes < 0)   # Products without category sort first
+        self._rows = {
+            category: order[end - count:end]
+            for category, count, end in zip(self.categories, counts.tolist(), bounds.tolist())
+        }
+
+    def rows(self, category: str) -> np.ndarray:
+        """Positions of the products in `category`, ascending (empty for unknown categories)."""
+        return self._rows.get(category, np.zeros(0, dtype=np.int64))
+
+    def matching(self, substring: str) -> np.ndarray:
+        """Positions of the products whose category contains `substring` (case-insensitive), ascending."""
+        substring = substring.lower()
+        parts = [rows for category, rows in self._rows.items() if substring in category.lower()]
+        return np.sort(np.concatenate(parts)) if parts else np.zeros(0, dtype=np.int64)
@@ -0,0 +1,85 @@
+"""
+snapshot_diff.py
+
+Change report between two versions of the processed price list.
+Both versions are joined once on the stable product key ("Numero") and every comparison is a
+column-wise (vectorized) operation on the joined frame, so no Python loop runs per product.
+"""
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+KEY = "Numero"
+COMPARED_COLUMNS = ["Tuotenimi", "Tyyppi", "Hinta", "Alkoholi%", "Pullokoko (l)"]
+
+
+@dataclass
+class PriceListDiff:
+    """Differences between an old and a new price list."""
+    new_products: pd.DataFrame        # Numero, Tuotenimi, Tyyppi, Hinta, Alkoholi%, Pullokoko (l)
+    delisted_products: pd.DataFrame   # Same columns, values from the old list
+    price_changes: pd.DataFrame       # Numero, Tuotenimi, Tyyppi, OldPrice, NewPrice, Change, ChangePct
+    spec_changes: pd.DataFrame        # Numero, Tuotenimi, Tyyppi, OldAlcohol%, NewAlcohol%, OldSize (l), NewSize (l)
+
+    def is_empty(self) -> bool:
+        return not (len(self.new_products) or len(self.delisted_products)
+                    or len(self.price_changes) or len(self.spec_changes))
+
+    def summary(self) -> str:
+        return (f"{len(self.new_products)} new, {len(self.delisted_products)} delisted, "
+                f"{len(self.price_changes)} price changes, {len(self.spec_changes)} ABV/size changes")
+
+
+def _changed(old: pd.Series, new: pd.Series, tolerance: float) -> np.ndarray:
+    """Element-wise "value differs" for float columns, ignoring float noise below `tolerance`."""
+    return ~np.isclose(old.to_numpy(dtype=np.float64), new.to_numpy(dtype=np.float64), atol=tolerance, rtol=0)
+
+
+def diff_price_lists(old_df: pd.DataFrame, new_df: pd.DataFrame) -> PriceListDiff:
+    """
+    Compare two processed price lists (as returned by fetch_and_process_data).
+    Products are matched on "Numero"; name and category in the report come from the newer list.
+    """
+    old = old_df[[KEY] + COMPARED_COLUMNS]
+    new = new_df[[KEY] + COMPARED_COLUMNS]
+    merged = old.merge(new, on=KEY, how="outer", suffixes=("_old", "_new"), indicator=True)
+
+    # New / delisted products: keys present on only one side of the join
+    in_new = merged["_merge"] == "right_only"
+    in_old = merged["_merge"] == "left_only"
+    new_cols = {f"{c}_new": c for c in COMPARED_COLUMNS}
+    old_cols = {f"{c}_old": c for c in COMPARED_COLUMNS}
+    new_products = merged.loc[in_new, [KEY] + list(new_cols)].rename(columns=new_cols)
+    delisted_products = merged.loc[in_old, [KEY] + list(old_cols)].rename(columns=old_cols)
+
+    # Products in both lists
+    both = merged[merged["_merge"] == "both"]
+    base = both[[KEY, "Tuotenimi_new", "Tyyppi_new"]].rename(
+        columns={"Tuotenimi_new": "Tuotenimi", "Tyyppi_new": "Tyyppi"})
+
+    # Price changes (prices have cent precision)
+    price_mask = _changed(both["Hinta_old"], both["Hinta_new"], 0.005)
+    price_changes = base[price_mask].assign(
+        OldPrice=both.loc[price_mask, "Hinta_old"],
+        NewPrice=both.loc[price_mask, "Hinta_new"],
+    )
+    price_changes["Change"] = price_changes["NewPrice"] - price_changes["OldPrice"]
+    price_changes["ChangePct"] = price_changes["Change"] / price_changes["OldPrice"] * 100
+    price_changes = price_changes.sort_values("ChangePct")
+
+    # ABV / bottle size changes
+    spec_mask = (_changed(both["Alkoholi%_old"], both["Alkoholi%_new"], 0.05)
+                 | _changed(both["Pullokoko (l)_old"], both["Pullokoko (l)_new"], 0.0005))
+    spec_changes = base[spec_mask].assign(**{
+        "OldAlcohol%": both.loc[spec_mask, "Alkoholi%_old"],
+        "NewAlcohol%": both.loc[spec_mask, "Alkoholi%_new"],
+        "OldSize (l)": both.loc[spec_mask, "Pullokoko (l)_old"],
+        "NewSize (l)": both.loc[spec_mask, "Pullokoko (l)_new"],
+    })
+
+    return PriceListDiff(
+        new_products=new_products.reset_index(drop=True),
+        delisted_products=delisted_products.reset_index(drop=True),
+        price_changes=price_changes.reset_index(drop=True),
+        spec_changes=spec_changes.reset_index(drop=True),
+    )
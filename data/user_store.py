@@ -0,0 +1,187 @@
+"""
+user_store.py
+
+Local SQLite store of the user's own data: personal spirit ratings and the bar shelf.
+- ratings:    one row per rated product, keyed on (spirit, product); spirit is the RatingSource name ("rum")
+- shelf:      one row per ingredient the user has at home
+- migrations: legacy JSON files already imported
+
+Saves only upsert/delete the changed keys in one transaction, so a crash mid-save leaves the previous
+state intact instead of a half-written file. The database runs in WAL mode, so the rating workers can
+read while the GUI thread writes.
+
+The JSON files used before (~/.alko_user_rum_ratings.json, ~/.alko_user_whiskey_ratings.json,
+~/.alko_app_shelf.json) are imported automatically the first time the store is opened; they are left in place
+as a backup but no longer read or written.
+"""
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+# Database file (stored in user's home directory, like the JSON files it replaces)
+USER_DB = Path.home() / ".alko_app_user.sqlite3"
+
+# Legacy JSON files: spirit ratings ({product name: rating}) and the bar shelf ([ingredient, ...])
+LEGACY_RATING_FILES = {
+    "rum": Path.home() / ".alko_user_rum_ratings.json",
+    "whiskey": Path.home() / ".alko_user_whiskey_ratings.json",
+}
+LEGACY_SHELF_FILE = Path.home() / ".alko_app_shelf.json"
+
+# Ratings are integers 0–100 (as entered in the user rating windows)
+RATING_RANGE = (0, 100)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ratings (
+    spirit  TEXT NOT NULL,
+    product TEXT NOT NULL,
+    rating  INTEGER NOT NULL,
+    PRIMARY KEY (spirit, product)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS shelf (
+    ingredient TEXT PRIMARY KEY
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS migrations (
+    source      TEXT PRIMARY KEY,
+    migrated_at TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def _legacy_rating_rows(spirit: str, data) -> list:
+    # (spirit, product, rating) rows of a legacy ratings file ({product name: rating}), invalid entries left out
+    if not isinstance(data, dict):
+        return []
+    rows = []
+    for name, rating in data.items():
+        try:
+            rating = int(rating)
+        except (TypeError, ValueError):
+            continue    # e.g. a hand-edited "85.5" or null
+        if RATING_RANGE[0] <= rating <= RATING_RANGE[1]:
+            rows.append((spirit, name, rating))
+    return rows
+
+
+def _legacy_shelf_rows(data) -> list:
+    # (ingredient,) rows of a legacy shelf file ([ingredient, ...]), non-string entries left out
+    if not isinstance(data, list):
+        return []
+    return [(ing,) for ing in data if isinstance(ing, str)]
+
+
+class UserStore:
+    """Read/write access to the user's ratings and bar shelf in the database at `db_path`."""
+
+    def __init__(self, db_path=USER_DB, legacy_rating_files=None, legacy_shelf_file=LEGACY_SHELF_FILE):
+        """legacy_*: JSON files to import on first use (None / {} to skip)"""
+        self.db_path = str(db_path)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")     # Persistent setting of the database file
+            conn.executescript(SCHEMA)
+        legacy_rating_files = LEGACY_RATING_FILES if legacy_rating_files is None else legacy_rating_files
+        self._migrate(legacy_rating_files, legacy_shelf_file)
+
+    def _connect(self):
+        # A short-lived connection per call, so the store can be used from the rating workers and the GUI thread.
+        # isolation_level=None: transactions are opened explicitly with BEGIN IMMEDIATE
+        return sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+
+    def _migrate(self, legacy_rating_files: dict, legacy_shelf_file):
+        """
+        Import each legacy JSON file once (skipped if missing or unreadable).
+        Malformed contents (wrong JSON type, ratings that aren't integers 0–100) are skipped entry by entry,
+        and the file still counts as migrated, so a hand-edited file can never stop the store from opening.
+        """
+        legacy = [(f"ratings:{spirit}", path) for spirit, path in legacy_rating_files.items()]
+        if legacy_shelf_file is not None:
+            legacy.append(("shelf", legacy_shelf_file))
+
+        with closing(self._connect()) as conn:
+            for source, path in legacy:
+                if not Path(path).exists():
+                    continue
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue    # Corrupt file (e.g. from an interrupted write): nothing to recover
+                # One transaction per file, which also makes a concurrent opener wait and then skip it
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    if conn.execute("SELECT 1 FROM migrations WHERE source = ?", (source,)).fetchone():
+                        conn.execute("ROLLBACK")
+                        continue
+                    if source == "shelf":
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO shelf (ingredient) VALUES (?)", _legacy_shelf_rows(data)
+                        )
+                    else:
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO ratings (spirit, product, rating) VALUES (?, ?, ?)",
+                            _legacy_rating_rows(source.split(":", 1)[1], data),
+                        )
+                    conn.execute(
+                        "INSERT INTO migrations (source, migrated_at) VALUES (?, ?)",
+                        (source, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                    )
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")    # e.g. database locked: the file is tried again on the next start
+
+    def _write(self, statements):
+        """Run (sql, rows) executemany statements in one atomic transaction."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, rows in statements:
+                    conn.executemany(sql, rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def load_ratings(self, spirit: str) -> dict:
+        """The user's saved ratings of one spirit ({product name: rating})."""
+        with closing(self._connect()) as conn:
+            return dict(conn.execute("SELECT product, rating FROM ratings WHERE spirit = ?", (spirit,)))
+
+    def save_ratings(self, spirit: str, changes: dict):
+        """Apply changed ratings ({product name: rating, or None to remove the rating}) in one transaction."""
+        upserts = [(spirit, name, int(rating)) for name, rating in changes.items() if rating is not None]
+        deletes = [(spirit, name) for name, rating in changes.items() if rating is None]
+        self._write([
+            ("INSERT INTO ratings (spirit, product, rating) VALUES (?, ?, ?) "
+             "ON CONFLICT(spirit, product) DO UPDATE SET rating = excluded.rating", upserts),
+            ("DELETE FROM ratings WHERE spirit = ? AND product = ?", deletes),
+        ])
+
+    def load_shelf(self) -> set:
+        """Ingredients on the user's bar shelf."""
+        with closing(self._connect()) as conn:
+            return {row[0] for row in conn.execute("SELECT ingredient FROM shelf")}
+
+    def update_shelf(self, added=(), removed=()):
+        """Add and remove bar shelf ingredients in one transaction."""
+        self._write([
+            ("INSERT OR IGNORE INTO shelf (ingredient) VALUES (?)", [(ing,) for ing in added]),
+            ("DELETE FROM shelf WHERE ingredient = ?", [(ing,) for ing in removed]),
+        ])
+
+
+def get_user_store() -> UserStore:
+    """The store at USER_DB, opened (and migrated) on first use."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = UserStore()
+        return _default_store
@@ -0,0 +1,71 @@
+"""
+xlsx_reader.py
+
+Column-projected streaming reader for the Alko price list workbook.
+The workbook is opened in openpyxl's read-only mode and iterated row by row, and only the requested
+columns are kept. Numeric columns go straight into float64 arrays, so the 30-column sheet is never
+materialized as a full DataFrame.
+"""
+import math
+from array import array
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+# How often (in rows) the should_cancel callback is polled
+CANCEL_CHECK_INTERVAL = 1000
+
+
+def _to_float(value) -> float:
+    """Convert a cell value ("12.90", 12.9, None...) to float, using NaN for anything non-numeric."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def read_columns(path: str, text_columns: list[str], numeric_columns: list[str], header_row: int = 4,
+                 should_cancel=None) -> pd.DataFrame:
+    """
+    Stream the first worksheet of `path` and return a DataFrame with only the requested columns.
+    - header_row is the 1-based row holding the column names (data starts on the row after it)
+    - text_columns keep their cell values as-is (None for empty cells)
+    - numeric_columns are parsed into float64 arrays (NaN for empty or non-numeric cells)
+    - should_cancel() is polled every CANCEL_CHECK_INTERVAL rows; returning True stops reading and returns None
+
+    Raises:
+    - ValueError if one of the requested columns is missing from the header row
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        sheet.reset_dimensions()    # Alko's file reports a wrong sheet size, which would truncate rows
+
+        header = next(sheet.iter_rows(min_row=header_row, max_row=header_row, values_only=True))
+        positions = {}
+        for name in text_columns + numeric_columns:
+            if name not in header:
+                raise ValueError(f"Column {name!r} not found in {path}")
+            positions[name] = header.index(name)
+        last_col = max(positions.values()) + 1   # Cells to the right of the last needed column are never read
+
+        text_values = {name: [] for name in text_columns}
+        numeric_values = {name: array("d") for name in numeric_columns}
+        text_targets = [(text_values[name].append, positions[name]) for name in text_columns]
+        numeric_targets = [(numeric_values[name].append, positions[name]) for name in numeric_columns]
+
+        for row_number, row in enumerate(sheet.iter_rows(min_row=header_row + 1, max_col=last_col, values_only=True)):
+            if should_cancel is not None and row_number % CANCEL_CHECK_INTERVAL == 0 and should_cancel():
+                return None
+            for append, i in text_targets:
+                append(row[i] if i < len(row) else None)
+            for append, i in numeric_targets:
+                append(_to_float(row[i]) if i < len(row) else math.nan)
+    finally:
+        workbook.close()
+
+    columns = {name: text_values[name] for name in text_columns}
+    columns.update({name: np.array(numeric_values[name], dtype=np.float64) for name in numeric_columns})
+    return pd.DataFrame(columns)[text_columns + numeric_columns]
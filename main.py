@@ -1,22 +1,34 @@
-from PyQt6.QtWidgets import QApplication
+from utils import startup_timer     # First import, so the startup clock starts as early as possible
+startup_timer.install()
+
 import sys
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
 from ui.main_window import MainWindow
 from utils.dark_theme import create_dark_palette
 from utils.light_theme import create_light_palette
 import darkdetect
 
+# Note: ui.main_window only imports PyQt6 up front. pandas, requests, rapidfuzz and the
+# secondary windows are imported the first time they are needed (data fetch / button clicks).
+
 def main():
-    app = QApplication(sys.argv)
+    with startup_timer.phase("create QApplication"):
+        app = QApplication(sys.argv)
 
-    if darkdetect.isDark():     # initialize darkmode and lightmode for the app
-        app.setPalette(create_dark_palette())
-        initial_theme = "dark"
-    else:
-        app.setPalette(create_light_palette())
-        initial_theme = "light"
+    with startup_timer.phase("detect theme"):
+        if darkdetect.isDark():     # initialize darkmode and lightmode for the app
+            app.setPalette(create_dark_palette())
+            initial_theme = "dark"
+        else:
+            app.setPalette(create_light_palette())
+            initial_theme = "light"
 
-    window = MainWindow(initial_theme)      # Create the main window
-    window.show()
+    with startup_timer.phase("create main window"):
+        window = MainWindow(initial_theme)      # Create the main window
+    with startup_timer.phase("show main window"):
+        window.show()
+    QTimer.singleShot(0, startup_timer.first_window_shown)     # Runs once the event loop is up
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+"""
+test_downloader.py
+
+data/downloader.py against a local HTTP stand-in server (http.server on localhost, serving one file with an ETag):
+a full download (200), an unchanged file (304), resuming a partial download (206)
+and restarting when the partial file doesn't fit the remote file anymore (416).
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from data.downloader import DownloadCancelled, download_file
+
+CONTENT = bytes(range(256)) * 400   # 100 KB
+ETAG = '"v1"'
+CHUNK_SIZE = 16 * 1024
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves `server.content` with ETag, conditional (If-None-Match) and range (Range / If-Range) support."""
+
+    def do_GET(self):
+        content, etag = self.server.content, self.server.etag
+        if self.headers.get("If-None-Match") == etag:
+            return self._respond(304)
+
+        byte_range = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if byte_range and (if_range is None or if_range == etag):
+            start = int(byte_range.removeprefix("bytes=").split("-")[0])
+            if start >= len(content):
+                return self._respond(416, headers={"Content-Range": f"bytes */{len(content)}"})
+            return self._respond(206, content[start:], {
+                "Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}",
+            })
+        return self._respond(200, content)
+
+    def _respond(self, status, body=b"", headers=None):
+        self.server.statuses.append(status)
+        self.send_response(status)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass    # Keep the test output clean
+
+
+class DownloadFileTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/price_list.xlsx"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.content, self.server.etag, self.server.statuses = CONTENT, ETAG, []
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dest = os.path.join(self.tmp.name, "price_list.xlsx")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read_dest(self):
+        with open(self.dest, "rb") as f:
+            return f.read()
+
+    def _download_part(self, chunks):
+        # Cancel after `chunks` chunks, leaving a partial file behind
+        seen = []
+        with self.assertRaises(DownloadCancelled):
+            download_file(self.url, self.dest, chunk_size=CHUNK_SIZE,
+                          should_cancel=lambda: seen.append(1) or len(seen) >= chunks)
+        self.assertFalse(os.path.exists(self.dest))
+        return os.path.getsize(self.dest + ".part")
+
+    def test_full_download(self):
+        result = download_file(self.url, self.dest, expected_content_type="octet-stream")
+        self.assertEqual(self.server.statuses, [200])
+        self.assertEqual((result.status, result.bytes_downloaded, result.bytes_saved), ("downloaded", len(CONTENT), 0))
+        self.assertEqual(self._read_dest(), CONTENT)
+        self.assertFalse(os.path.exists(self.dest + ".part"))
+
+    def test_not_modified(self):
+        download_file(self.url, self.dest)
+        result = download_file(self.url, self.dest)
+        self.assertEqual(self.server.statuses, [200, 304])
+        self.assertEqual((result.status, result.bytes_downloaded, result.bytes_saved), ("not_modified", 0, len(CONTENT)))
+        self.assertIn("saved", result.summary())
+        self.assertEqual(self._read_dest(), CONTENT)
+
+    def test_resume(self):
+        partial = self._download_part(2)
+        self.assertLess(partial, len(CONTENT))
+        result = download_file(self.url, self.dest)
+        self.assertEqual(self.server.statuses, [200, 206])
+        self.assertEqual((result.status, result.bytes_downloaded, result.bytes_saved),
+                         ("resumed", len(CONTENT) - partial, partial))
+        self.assertEqual(self._read_dest(), CONTENT)
+
+    def test_restart_after_416(self):
+        partial = self._download_part(3)
+        self.server.content = CONTENT[:partial // 2]    # Remote file shrank under the same ETag
+        result = download_file(self.url, self.dest)
+        self.assertEqual(self.server.statuses, [200, 416, 200])
+        self.assertEqual((result.status, result.bytes_downloaded), ("downloaded", len(self.server.content)))
+        self.assertEqual(self._read_dest(), self.server.content)
+
+    def test_changed_file_is_downloaded_again(self):
+        download_file(self.url, self.dest)
+        self.server.content, self.server.etag = CONTENT[::-1], '"v2"'
+        result = download_file(self.url, self.dest)
+        self.assertEqual(self.server.statuses, [200, 200])
+        self.assertEqual(result.status, "downloaded")
+        self.assertEqual(self._read_dest(), CONTENT[::-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
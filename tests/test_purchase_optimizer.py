@@ -0,0 +1,102 @@
+"""
+test_purchase_optimizer.py
+
+"Which Bottles to Buy?" (data/purchase_optimizer.py) on a hand-built IngredientIndex and price list:
+the product chosen for each ingredient, and the suggested bottles checked against a plain recount of the
+recipes (budget and bottle count respected, each pick credited with exactly the recipes it makes possible,
+grocery ingredients available, recipes needing an ingredient Alko doesn't sell never counted).
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+import unittest
+import pandas as pd
+from data.ingredient_index import IngredientIndex
+from data.purchase_optimizer import BottleOptimizer, cheapest_products
+from utils.ingredients_mapper import ALKO_PRODUCTS
+
+RECIPES = [
+    ["Vodka", "Orange Juice"],                  # 0: one bottle + grocery ingredient
+    ["Vodka", "Lime Juice", "Sugar Syrup"],     # 1
+    ["Gin", "Tonic Water"],                     # 2
+    ["Gin", "Campari", "Sweet Vermouth"],       # 3: three bottles
+    ["Vodka", "Kiwi Liqueur"],                  # 4: Kiwi Liqueur isn't sold
+    ["Orange Juice", "Lime Juice"],             # 5: makeable from the start
+    ["Amaretto", "Lemon Juice"],                # 6
+    ["Amaretto", "Triple Sec"],                 # 7: two bottles
+    ["Triple Sec", "Vodka", "Lime Juice"],      # 8
+]
+
+# (name, category, price, size, alcohol)
+PRODUCTS = [
+    ("Test Vodka", "vodkat ja viinat", 10.0, 0.7, 40.0),
+    ("Test Vodka Litre", "vodkat ja viinat", 13.0, 1.0, 40.0),          # Cheapest per litre
+    ("Test Vodka Mini", "vodkat ja viinat", 2.0, 0.05, 40.0),           # Miniature
+    ("Test Vodka Box", "vodkat ja viinat", 15.0, 1.5, 40.0),            # Over a standard bottle
+    ("Koskenkorva Spirit Drink", "vodkat ja viinat", 5.0, 0.5, 21.0),   # Too weak
+    ("Test Gin", "ginit ja maustetut viinat", 20.0, 0.7, 40.0),
+    ("Campari", "liköörit ja katkerot", 15.0, 0.7, 25.0),
+    ("Martini Rosso", "jälkiruokaviinit, väkevöidyt ja muut viinit", 10.0, 0.75, 15.0),
+    ("Disaronno", "liköörit ja katkerot", 12.0, 0.7, 28.0),
+    ("Cointreau", "liköörit ja katkerot", 18.0, 0.7, 40.0),
+]
+
+
+def price_list():
+    df = pd.DataFrame(PRODUCTS, columns=["Tuotenimi", "Tyyppi", "Hinta", "Pullokoko (l)", "Alkoholi%"])
+    df["Tyyppi"] = df["Tyyppi"].astype("category")
+    df["Numero"] = [str(100 + i) for i in range(len(df))]
+    return df
+
+
+def makeable(shelf):
+    # Recipes whose ingredients are all on the shelf or from the grocery store
+    return {r for r, ings in enumerate(RECIPES) if all(ing in shelf or ing not in ALKO_PRODUCTS for ing in ings)}
+
+
+class BottleOptimizerTest(unittest.TestCase):
+    def setUp(self):
+        self.alko_df = price_list()
+        self.optimizer = BottleOptimizer(self.alko_df, IngredientIndex.from_lists(RECIPES))
+
+    def test_products(self):
+        products = {ing: self.alko_df["Tuotenimi"].iat[row] for ing, row in cheapest_products(self.alko_df).items()}
+        self.assertEqual(products["Vodka"], "Test Vodka Litre")
+        self.assertEqual(products["Sweet Vermouth"], "Martini Rosso")
+        self.assertNotIn("Kiwi Liqueur", products)
+
+    def test_picks_against_recount(self):
+        for shelf in (set(), {"Gin"}, {"Vodka", "Amaretto"}):
+            for budget in (0, 9.99, 13, 25, 40, 1000):
+                for bottles in (1, 2, 3, 10):
+                    with self.subTest(shelf=shelf, budget=budget, bottles=bottles):
+                        picks = self.optimizer.suggest(shelf, budget, bottles)
+                        self.assertLessEqual(sum(pick.price for pick in picks), budget + 1e-9)
+                        self.assertLessEqual(len(picks), bottles)
+
+                        have = set(shelf)
+                        for pick in picks:
+                            self.assertNotIn(pick.ingredient, have)
+                            before = makeable(have)
+                            have.add(pick.ingredient)
+                            self.assertEqual(set(pick.unlocked), makeable(have) - before)
+                            self.assertNotIn(4, pick.unlocked)  # Needs Kiwi Liqueur
+
+    def test_grocery_ingredients_are_available(self):
+        picks = self.optimizer.suggest(set(), 13, 1)
+        self.assertEqual([(pick.ingredient, pick.product, pick.price) for pick in picks],
+                         [("Vodka", "Test Vodka Litre", 13.0)])
+        self.assertEqual(set(picks[0].unlocked), {0, 1})   # Juices and syrup count as at hand
+
+    def test_two_bottle_bundle(self):
+        # Amaretto + Triple Sec complete 6, 7 (and 8 with the Vodka on the shelf) only together
+        picks = self.optimizer.suggest({"Vodka"}, 30, 2)
+        self.assertEqual({pick.ingredient for pick in picks}, {"Amaretto", "Triple Sec"})
+        self.assertEqual(set().union(*(pick.unlocked for pick in picks)), {6, 7, 8})
+
+    def test_nothing_affordable(self):
+        self.assertEqual(self.optimizer.suggest(set(), 5, 3), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
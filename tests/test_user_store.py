@@ -0,0 +1,61 @@
+"""
+test_user_store.py
+
+Import of the legacy JSON files into data/user_store.py: valid entries are kept, malformed contents are
+skipped without stopping the store from opening, and every file is imported only once.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+import json
+import os
+import tempfile
+import unittest
+from data.user_store import UserStore
+
+
+class LegacyMigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "user.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content if isinstance(content, str) else json.dumps(content))
+        return path
+
+    def _open(self, rum, shelf):
+        return UserStore(self.db_path, {"rum": self._write("rum.json", rum)}, self._write("shelf.json", shelf))
+
+    def test_valid_files(self):
+        store = self._open({"Kraken": 88, "Bacardi": "70"}, ["Rum", "Lime"])
+        self.assertEqual(store.load_ratings("rum"), {"Kraken": 88, "Bacardi": 70})
+        self.assertEqual(store.load_shelf(), {"Rum", "Lime"})
+
+    def test_malformed_entries_are_skipped(self):
+        store = self._open({"Kraken": 88, "X": "85.5", "Y": None, "Z": 101, "W": [1]}, ["Rum", None, 3])
+        self.assertEqual(store.load_ratings("rum"), {"Kraken": 88})
+        self.assertEqual(store.load_shelf(), {"Rum"})
+
+    def test_wrong_json_types(self):
+        for rum, shelf in (([88], "null"), ("null", {"Rum": True}), ("7", "broken")):
+            with self.subTest(rum=rum, shelf=shelf):
+                store = self._open(rum, shelf)
+                self.assertEqual(store.load_ratings("rum"), {})
+                self.assertEqual(store.load_shelf(), set())
+                os.remove(self.db_path)
+
+    def test_imported_once(self):
+        store = self._open({"X": "85.5"}, None)
+        store.save_ratings("rum", {"Kraken": 90})
+        self._open({"Kraken": 10, "Havana": 80}, ["Rum"])  # Edited after the import: not read again
+        self.assertEqual(store.load_ratings("rum"), {"Kraken": 90})
+        self.assertEqual(store.load_shelf(), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
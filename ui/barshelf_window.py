@@ -1,32 +1,27 @@
-import json
-import os
-from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QCheckBox,
     QPushButton, QHBoxLayout
 )
 from PyQt6.QtCore import pyqtSignal, Qt
+from data.user_store import get_user_store
 
 class BarShelfWindow(QWidget):
     # signal emitted after the user saves their bar-shelf
     saved = pyqtSignal()
 
-    def __init__(self, ingredients: list[str], config_path: Path):
+    def __init__(self, ingredients: list[str], store=None):
         """
         Initializes the BarShelfWindow.
         Allows the user to check/uncheck ingredients they have in their personal bar shelf.
+        store: UserStore the shelf is saved in (default: the one in the user's home directory)
         """
         super().__init__()
         self.setWindowTitle("Manage My Bar Shelf")
         self.resize(400, 600)
-        self.config_path = config_path
+        self.store = store if store is not None else get_user_store()
 
-        # Load existing saved shelf (JSON)
-        if config_path.exists():
-            with open(config_path, "r") as f:
-                have = set(json.load(f))
-        else:
-            have = set()
+        # Load existing saved shelf
+        self.have = self.store.load_shelf()
 
         layout = QVBoxLayout(self)
 
@@ -39,7 +34,7 @@ class BarShelfWindow(QWidget):
         self.checks: dict[str, QCheckBox] = {}
         for ing in ingredients:
             cb = QCheckBox(ing)
-            cb.setChecked(ing in have)  # pre-check if already owned
+            cb.setChecked(ing in self.have)  # pre-check if already owned
             vbox.addWidget(cb)
             self.checks[ing] = cb
 
@@ -63,15 +58,11 @@ class BarShelfWindow(QWidget):
 
     def _save_and_close(self):
         """
-        Save the checked ingredients to a JSON file, emit the saved signal, and close the window.
+        Save the changed ingredients to the store (one transaction), emit the saved signal, and close the window.
         """
-        # Gather the checked ingredients
-        picked = [ing for ing, cb in self.checks.items() if cb.isChecked()]
-
-        # Ensure directory exists
-        os.makedirs(self.config_path.parent, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            json.dump(picked, f, indent=2)
+        # Gather the ingredients checked/unchecked since opening
+        picked = {ing for ing, cb in self.checks.items() if cb.isChecked()}
+        self.store.update_shelf(added=picked - self.have, removed=(self.checks.keys() - picked) & self.have)
 
         self.saved.emit()  # let CocktailsWindow know to re-filter
         self.close()
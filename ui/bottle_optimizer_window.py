@@ -0,0 +1,121 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QLabel,
+    QDoubleSpinBox, QSpinBox
+)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+from utils.style_manager import get_table_stylesheet
+from data.user_store import get_user_store
+
+"""
+bottle_optimizer_window.py
+
+"Which Bottles to Buy?": the Alko bottles that make the most new cocktails makeable with the user's bar shelf,
+within a budget and a number of bottles (see data/purchase_optimizer.py). Recomputed whenever either changes.
+"""
+
+DEFAULT_BUDGET = 100.0
+DEFAULT_BOTTLES = 3
+MAX_BOTTLES = 10
+
+COLUMNS = ["Ingredient", "Alko Product", "Price (€)", "New Cocktails", "Cocktails"]
+
+
+class BottleOptimizerWindow(QWidget):
+    def __init__(self, optimizer, cocktail_names, theme="light", store=None):
+        """
+        optimizer: BottleOptimizer of the current price list and cocktail recipes
+        cocktail_names: name of every recipe (row positions of the optimizer's IngredientIndex)
+        store: UserStore holding the bar shelf (default: the one in the user's home directory)
+        """
+        super().__init__()
+        self.setWindowTitle("Which Bottles to Buy?")
+        self.resize(1100, 500)
+        self.current_theme = theme
+        self.optimizer = optimizer
+        self.cocktail_names = cocktail_names
+        self.store = store if store is not None else get_user_store()
+        layout = QVBoxLayout(self)
+
+        title_label = QLabel("Which Bottles to Buy?")
+        title_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title_label)
+
+        info_label = QLabel(
+            "The Alko bottles (best value per litre) that let you make the most new cocktails with your bar shelf.\n"
+            "Juices, syrups, fruit and other grocery ingredients are assumed to be at hand."
+        )
+        info_label.setFont(QFont("Arial", 10))
+        info_label.setWordWrap(True)
+        info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(info_label)
+
+        # Budget + number of bottles row
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Budget (€):"))
+        self.budget_spin = QDoubleSpinBox()
+        self.budget_spin.setRange(0.0, 10000.0)
+        self.budget_spin.setSingleStep(10.0)
+        self.budget_spin.setValue(DEFAULT_BUDGET)
+        self.budget_spin.valueChanged.connect(self.refresh)
+        controls.addWidget(self.budget_spin)
+
+        controls.addWidget(QLabel("Bottles:"))
+        self.bottles_spin = QSpinBox()
+        self.bottles_spin.setRange(1, MAX_BOTTLES)
+        self.bottles_spin.setValue(DEFAULT_BOTTLES)
+        self.bottles_spin.valueChanged.connect(self.refresh)
+        controls.addWidget(self.bottles_spin)
+        controls.addStretch(1)
+        layout.addLayout(controls)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.setAlternatingRowColors(True)
+        layout.addWidget(self.table)
+
+        self.summary_label = QLabel()
+        self.summary_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.summary_label)
+
+        self.refresh()
+        self.apply_table_stylesheet()
+
+    def set_optimizer(self, optimizer, cocktail_names):
+        """Use a new optimizer (the price list was fetched again) and recompute."""
+        self.optimizer = optimizer
+        self.cocktail_names = cocktail_names
+        self.refresh()
+
+    def refresh(self, *_):
+        """Suggest bottles for the saved bar shelf and the current budget / number of bottles."""
+        picks = self.optimizer.suggest(
+            self.store.load_shelf(), self.budget_spin.value(), self.bottles_spin.value()
+        )
+        self.table.setRowCount(len(picks))
+        for row, pick in enumerate(picks):
+            names = [self.cocktail_names[i] for i in pick.unlocked]
+            cells = [pick.ingredient, pick.product, f"{pick.price:.2f}", str(len(names)), ", ".join(names)]
+            for col, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if col in (2, 3):
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                if col == 1:
+                    item.setToolTip(f"Alko product number {pick.number}")
+                if col == 4:
+                    item.setToolTip("\n".join(names))
+                self.table.setItem(row, col, item)
+
+        if picks:
+            total = sum(pick.price for pick in picks)
+            unlocked = sum(len(pick.unlocked) for pick in picks)
+            self.summary_label.setText(f"{len(picks)} bottles for {total:.2f} € make {unlocked} new cocktails.")
+        else:
+            self.summary_label.setText("No bottle within the budget makes a new cocktail.")
+
+    def apply_table_stylesheet(self):
+        """Apply light/dark theme CSS to table."""
+        self.table.setStyleSheet(get_table_stylesheet(self.current_theme))
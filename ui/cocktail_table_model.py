@@ -0,0 +1,78 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+"""
+cocktail_table_model.py
+
+Read-only Qt table model of the cocktail list (Drink Type, Name, Ingredients, Missing), in the same way as
+DataFrameTableModel: the recipe columns are kept as lists, filtering swaps in an array of row positions,
+and the text is only looked up in data() for the rows the view shows.
+The "Missing" column (ingredients lacking from the bar shelf) is worked out the same lazy way, per visible row.
+"""
+
+# (recipe DataFrame column, header label) of each column before "Missing"
+COLUMNS = [("strCategory", "Drink Type"), ("strDrink", "Name"), ("ingredients_text", "Ingredients")]
+MISSING_COLUMN = len(COLUMNS)
+
+
+class CocktailTableModel(QAbstractTableModel):
+    def __init__(self, df, ingredient_index, parent=None):
+        """
+        df: recipes DataFrame from load_cocktails (with the "ingredients_text"/"ingredients_tooltip" columns)
+        ingredient_index: IngredientIndex of the same recipes, for the Missing column
+        """
+        super().__init__(parent)
+        self._values = [   # Missing (NaN) cells shown empty
+            [value if isinstance(value, str) else "" for value in df[name].tolist()] for name, _ in COLUMNS
+        ]
+        self._tooltips = df["ingredients_tooltip"].tolist()
+        self._index = ingredient_index
+        self._rows = range(len(df))     # Positions of the recipes shown
+        self._shelf = None              # Bar shelf the Missing column is computed against (None: column empty)
+        self._missing = {}              # Recipe position -> Missing text, filled as rows are shown
+
+    def set_rows(self, rows, shelf=None):
+        """
+        Show only the given recipe positions (range, list or integer numpy array, in display order).
+        shelf: fill the Missing column with each recipe's ingredients that are not in this bar shelf
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._shelf = None if shelf is None else set(shelf)
+        self._missing = {}
+        self.endResetModel()
+
+    def row_position(self, row: int) -> int:
+        """Position in the recipes DataFrame of the given view row."""
+        return int(self._rows[row])
+
+    def _missing_text(self, position: int) -> str:
+        if self._shelf is None:
+            return ""
+        if position not in self._missing:
+            self._missing[position] = ", ".join(self._index.missing_ingredients([position], self._shelf)[0])
+        return self._missing[position]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS) + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column, position = index.column(), self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == MISSING_COLUMN:
+                return self._missing_text(position)
+            return self._values[column][position]
+        if role == Qt.ItemDataRole.ToolTipRole and column == 2:
+            return self._tooltips[position]     # Ingredients one per line
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == 0:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section][1] if section < MISSING_COLUMN else "Missing"
+        return super().headerData(section, orientation, role)
@@ -1,11 +1,9 @@
 import os
-import json
 import sys
-from pathlib import Path
-import pandas as pd
+import numpy as np
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
-    QHeaderView, QMessageBox, QLineEdit, QLabel, QHBoxLayout, QComboBox, QPushButton
+    QWidget, QVBoxLayout, QTableView,
+    QHeaderView, QMessageBox, QLineEdit, QLabel, QHBoxLayout, QComboBox, QPushButton, QSpinBox
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QStandardItemModel, QStandardItem, QFont
@@ -14,10 +12,14 @@ from PyQt6.QtGui import QStandardItemModel, QStandardItem, QFont
 from utils.style_manager import get_table_stylesheet, get_search_input_stylesheet
 from ui.cocktail_details import CocktailDetailWindow
 from ui.barshelf_window import BarShelfWindow
-from utils.ingredients_mapper import normalize_ingredient, FAMILY_OF
+from ui.bottle_optimizer_window import BottleOptimizerWindow
+from ui.cocktail_table_model import CocktailTableModel
+from data.cocktails import load_cocktails
+from data.user_store import get_user_store
+from data.purchase_optimizer import BottleOptimizer
 
-# Path to saved ingredients file (users bar shelf)
-CONFIG_PATH = Path.home() / ".alko_app_shelf.json"
+# Largest number of missing ingredients selectable for "What Can I Make?"
+MAX_MISSING = 5
 
 def get_assets_path():
     """Returns correct path to the assets/ folder depending on if we're in PyInstaller or dev mode."""
@@ -26,31 +28,30 @@ def get_assets_path():
     return os.path.abspath('assets')    # In development (run from code)
 
 class CocktailsWindow(QWidget):
-    def __init__(self, csv_path: str, theme="light"):
-        """Initializes the cocktail window with the given dataset path and theme."""
+    def __init__(self, csv_path: str, theme="light", cocktails=None, alko_df=None, category_index=None, store=None):
+        """
+        Initializes the cocktail window with the given dataset path and theme.
+        cocktails: (recipes DataFrame, IngredientIndex) as returned by load_cocktails(csv_path), if already loaded
+        alko_df, category_index: current Alko price list and its CategoryIndex, for "Which Bottles to Buy?"
+        store: UserStore holding the bar shelf (default: the one in the user's home directory)
+        """
         super().__init__()
         self.current_theme = theme
+        self.store = store if store is not None else get_user_store()
+        self.alko_df = alko_df
+        self.category_index = category_index
+        self.optimizer = None       # BottleOptimizer of alko_df, built on first use
+        self.bottle_window = None
         # Window title and size
         self.setWindowTitle("Cocktail List")
         self.resize(1100, 900)
 
-        # Load data
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"CSV not found: {csv_path}")
-        full_path = os.path.join(get_assets_path(), csv_path) if not os.path.isabs(csv_path) else csv_path
-        self.df_all = pd.read_csv(full_path)
-
-        # Build ingredient list for each row
-        def make_ing_list(row):
-            out = []
-            for i in range(1, 16):
-                raw = row.get(f"strIngredient{i}")
-                if pd.notna(raw) and raw.strip():   # Normalize
-                    out.append(normalize_ingredient(raw))
-            return out
-
-        self.df_all["ingredients_list"] = self.df_all.apply(make_ing_list, axis=1)
-        self.df_current = self.df_all.copy()    # df_current will be filtered version
+        # Load data (unless it was already loaded in the background, see data/cocktails.py)
+        if cocktails is None:
+            full_path = os.path.join(get_assets_path(), csv_path) if not os.path.isabs(csv_path) else csv_path
+            cocktails = load_cocktails(full_path)
+        self.df_all, self.ingredient_index = cocktails     # Recipes + bitsets of their ingredients for the filters
+        self.recipe_names = self.df_all["strDrink"]
 
         # LAYOUT SETUP
         layout = QVBoxLayout(self)
@@ -95,12 +96,29 @@ class CocktailsWindow(QWidget):
         self.btn_show_mine.clicked.connect(self.show_makeable)
         search_layout.addWidget(self.btn_show_mine)
 
+        # "Almost makeable": how many shelf ingredients a shown cocktail may be missing
+        search_layout.addWidget(QLabel("Missing at most:"))
+        self.missing_spin = QSpinBox()
+        self.missing_spin.setRange(0, MAX_MISSING)
+        self.missing_spin.setToolTip("Also show cocktails missing up to this many ingredients from your bar")
+        self.missing_spin.valueChanged.connect(self.on_max_missing_changed)
+        search_layout.addWidget(self.missing_spin)
+        self.showing_makeable = False   # Table shows the "What Can I Make?" result
+
+        # Which Bottles to Buy button (needs the price list)
+        self.btn_buy = QPushButton("Which Bottles to Buy?")
+        self.btn_buy.setEnabled(alko_df is not None)
+        self.btn_buy.clicked.connect(self.open_bottle_optimizer)
+        search_layout.addWidget(self.btn_buy)
+
         layout.addLayout(search_layout)
 
-        # 3-column list: Category, Name, Ingredients (Cocktail table)
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Drink Type", "Name", "Ingredients"])
+        # 4-column list: Category, Name, Ingredients, Missing (Cocktail table; the model only formats the
+        # visible rows, so filtering shows any number of recipes without building items)
+        self.table_model = CocktailTableModel(self.df_all, self.ingredient_index, self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         # Stretch columns to fill width
         self.table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
@@ -116,10 +134,8 @@ class CocktailsWindow(QWidget):
         search_layout.addWidget(self.ing_combo)
 
         # Group all ingredients by their “family”
-        all_ings = sorted({ing for lst in self.df_all["ingredients_list"] for ing in lst})
         groups = {}
-        for ing in all_ings:
-            fam = FAMILY_OF.get(ing, "Other")
+        for ing, fam in zip(self.ingredient_index.ingredients, self.ingredient_index.families):
             groups.setdefault(fam, []).append(ing)
 
         # define the order in which families appear
@@ -152,94 +168,103 @@ class CocktailsWindow(QWidget):
 
 
         # Populate Table
-        self.apply_filters()  # will populate self.df_current
+        self.apply_filters()
         self.apply_table_stylesheet()
 
         # Double-click a row to open details
-        self.table.cellDoubleClicked.connect(self.open_detail)
+        self.table.doubleClicked.connect(self.open_detail)
 
 
     def apply_filters(self):
         """Apply both name and ingredient filters."""
         term = self.search_input.text().strip().lower()
 
-        # 1) Name filter (case-insensitive substring match)
-        if term:
-            df = self.df_all[self.df_all["strDrink"]
-            .str.contains(term, case=False, regex=False)]
-        else:
-            df = self.df_all
-
-        # 2) Ingredient filter (must contain all checked ingredients)
+        # 1) Ingredient filter (must contain all checked ingredients, bitset test over all recipes)
         checked = [
             self.ing_combo.model().item(row).text()
             for row in range(self.ing_combo.model().rowCount())
             if self.ing_combo.model().item(row).checkState() == Qt.CheckState.Checked
         ]
-        if checked:
-            df = df[df["ingredients_list"]
-            .apply(lambda ings: all(chip in ings for chip in checked))]
-
-        self.df_current = df
-        self._populate_table(df)
-
-    def _populate_table(self, df: pd.DataFrame):
-        """Fill the table with Category, Name, and Ingredients."""
-        self.table.setRowCount(len(df))
-        for i, (_, row) in enumerate(df.iterrows()):
-            # Column 0: Category, centered
-            cat_item = QTableWidgetItem(str(row.get("strCategory", "")))
-            cat_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 0, cat_item)
-
-            # Column 1: Cocktail name
-            self.table.setItem(i, 1, QTableWidgetItem(row.get("strDrink", "")))
-
-            # Column 2: ingredients
-            ingredients = []
-            for j in range(1, 16):
-                ing = row.get(f"strIngredient{j}")
-                meas = row.get(f"strMeasure{j}")
-                if pd.notna(ing) and ing:
-                    if pd.notna(meas) and meas:
-                        ingredients.append(f"{meas.strip()} {ing.strip()}")
-                    else:
-                        ingredients.append(ing.strip())
-            ing_text = ", ".join(ingredients)
-            ing_item = QTableWidgetItem(ing_text)
-            ing_item.setToolTip("\n".join(ingredients))
-            self.table.setItem(i, 2, ing_item)
+        rows = np.flatnonzero(self.ingredient_index.containing_all(checked)) if checked else np.arange(len(self.df_all))
+
+        # 2) Name filter (case-insensitive substring match)
+        if term:
+            rows = rows[self.recipe_names.iloc[rows].str.contains(term, case=False, regex=False).to_numpy()]
+
+        self.showing_makeable = False
+        self.table_model.set_rows(rows)
 
     def apply_table_stylesheet(self):
         """Apply light/dark theme CSS to table."""
         self.table.setStyleSheet(get_table_stylesheet(self.current_theme))
         self.search_input.setStyleSheet(get_search_input_stylesheet(self.current_theme))
+        if self.bottle_window is not None:
+            self.bottle_window.current_theme = self.current_theme
+            self.bottle_window.apply_table_stylesheet()
 
-    def open_detail(self, row, _col):
+    def open_detail(self, index):
         """On double-click, open a detail window for cocktail."""
-        data = self.df_current.iloc[row]
+        data = self.df_all.iloc[self.table_model.row_position(index.row())]
         self.detail_window = CocktailDetailWindow(data)
         self.detail_window.show()
 
     def open_barshelf(self):
         """Open the BarShelfWindow, passing in all ingredients."""
-        all_ing = sorted({ing for lst in self.df_all["ingredients_list"] for ing in lst})
-        self.barshelf = BarShelfWindow(all_ing, CONFIG_PATH)
+        all_ing = self.ingredient_index.ingredients     # Already sorted
+        self.barshelf = BarShelfWindow(all_ing, self.store)
         self.barshelf.saved.connect(self.apply_filters)
+        self.barshelf.saved.connect(self._refresh_bottle_window)
         self.barshelf.show()
 
+    def set_products(self, alko_df, category_index=None):
+        """Use a newly fetched price list for "Which Bottles to Buy?"."""
+        self.alko_df = alko_df
+        self.category_index = category_index
+        self.optimizer = None
+        self.btn_buy.setEnabled(alko_df is not None)
+        if self.bottle_window is not None and alko_df is not None:
+            self.bottle_window.set_optimizer(self._get_optimizer(), self.recipe_names.tolist())
+
+    def _get_optimizer(self):
+        # Maps every ingredient to its best-value Alko bottle once per price list
+        if self.optimizer is None:
+            self.optimizer = BottleOptimizer(self.alko_df, self.ingredient_index, self.category_index)
+        return self.optimizer
+
+    def open_bottle_optimizer(self):
+        """Open the "Which Bottles to Buy?" window (kept after closing and reused)."""
+        if self.bottle_window is None:
+            self.bottle_window = BottleOptimizerWindow(
+                self._get_optimizer(), self.recipe_names.tolist(), self.current_theme, self.store
+            )
+        else:
+            self.bottle_window.refresh()    # The bar shelf may have changed since
+        self.bottle_window.show()
+        self.bottle_window.raise_()
+        self.bottle_window.activateWindow()
+
+    def _refresh_bottle_window(self):
+        # Suggestions depend on the bar shelf
+        if self.bottle_window is not None:
+            self.bottle_window.refresh()
+
 
     def show_makeable(self):
-        """Show cocktails whose ingredients are all in the user’s saved bar."""
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, "r") as f:
-                have = set(json.load(f))
+        """
+        Show cocktails whose ingredients are all in the user’s saved bar,
+        or that miss at most the chosen number of them (fewest missing first, listing what is missing).
+        """
+        have = self.store.load_shelf()
+
+        max_missing = self.missing_spin.value()
+        if max_missing == 0:
+            self.table_model.set_rows(np.flatnonzero(self.ingredient_index.makeable(have)))   # Bitset test only
         else:
-            have = set()
-
-        df = self.df_all[
-            self.df_all["ingredients_list"]
-                .apply(lambda ings: all(i in have for i in ings))
-        ]
-        self.df_current = df
-        self._populate_table(df)
\ No newline at end of file
+            rows, _ = self.ingredient_index.almost_makeable(have, max_missing)
+            self.table_model.set_rows(rows, shelf=have)     # Missing ingredients listed per visible row
+        self.showing_makeable = True
+
+    def on_max_missing_changed(self, _value):
+        """Re-run "What Can I Make?" with the new number of allowed missing ingredients."""
+        if self.showing_makeable:
+            self.show_makeable()
\ No newline at end of file
@@ -0,0 +1,93 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from data.data_handler import (
+    BACKUP_FILENAME, download_price_list, load_cached_price_list, read_price_list, clean_price_list,
+    store_cached_price_list, record_price_history, load_price_changes
+)
+from data.downloader import DownloadCancelled
+
+"""
+fetch_worker.py
+
+Background pipeline for fetching the Alko price list: download -> parse -> transform -> publish.
+The worker is moved to a QThread by MainWindow, so the GUI stays responsive while it runs.
+Results are only handed back (published) once the whole DataFrame is ready.
+"""
+
+
+class FetchCancelled(Exception):
+    """Raised inside the worker when the user cancels between stages."""
+
+
+class PriceListWorker(QObject):
+    progress = pyqtSignal(int, str)         # Percent done (0–100), current stage description
+    downloaded = pyqtSignal(object)         # DownloadResult of the fetch (None if the backup file was used)
+    data_ready = pyqtSignal(object, bool)   # Cleaned DataFrame, whether the backup file was used
+    changes_ready = pyqtSignal(object)      # PriceListDiff against the previous price list (or None)
+    failed = pyqtSignal(str)                # Error message
+    cancelled = pyqtSignal()
+    done = pyqtSignal()                     # Always emitted last (success, failure or cancel)
+
+    # Share of the progress bar given to each stage
+    DOWNLOAD_END = 50
+    PARSE_END = 85
+    TRANSFORM_END = 95
+
+    def __init__(self):
+        super().__init__()
+        self._cancel_requested = False
+
+    def cancel(self):
+        """Request cancellation. Called from the GUI thread, checked by the worker between chunks and stages."""
+        self._cancel_requested = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_requested
+
+    def _check_cancel(self):
+        if self._cancel_requested:
+            raise FetchCancelled()
+
+    def _on_download_progress(self, done: int, total: int):
+        if total:
+            self.progress.emit(int(done / total * self.DOWNLOAD_END), "Downloading price list…")
+
+    def run(self):
+        """Runs every stage of the pipeline. Executed in the worker thread."""
+        try:
+            # 1) Download (conditional, so usually just a quick 304 check)
+            self.progress.emit(0, "Downloading price list…")
+            read_path, download = download_price_list(
+                progress=self._on_download_progress, should_cancel=self.is_cancelled
+            )
+            self.downloaded.emit(download)
+            self._check_cancel()
+
+            # 2) Parse (skipped entirely when the processed cache is still valid)
+            self.progress.emit(self.DOWNLOAD_END, "Reading price list…")
+            df, source_hash = load_cached_price_list(read_path)
+            if df is None:
+                raw_df = read_price_list(read_path, should_cancel=self.is_cancelled)
+                self._check_cancel()
+
+                # 3) Transform
+                self.progress.emit(self.PARSE_END, "Processing products…")
+                df = clean_price_list(raw_df)
+                store_cached_price_list(df, source_hash)
+            self._check_cancel()
+
+            used_backup = read_path == BACKUP_FILENAME
+            changes = None
+            if not used_backup:
+                record_price_history(df, source_hash)
+                changes = load_price_changes(df, source_hash)
+
+            # 4) Publish (handled by the GUI thread through the data_ready signal)
+            self.progress.emit(self.TRANSFORM_END, "Updating table…")
+            self.data_ready.emit(df, used_backup)
+            self.changes_ready.emit(changes)
+        except (FetchCancelled, DownloadCancelled):
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.done.emit()
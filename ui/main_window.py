@@ -1,20 +1,26 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMessageBox, QComboBox, QLabel, QLineEdit, QApplication
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
+    QHeaderView, QMessageBox, QComboBox, QLabel, QLineEdit, QApplication, QProgressBar
 )
 import os
 import sys
 from pathlib import Path
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt
-from data.data_handler import fetch_and_process_data
+from PyQt6.QtCore import Qt, QThread, QTimer
 from datetime import datetime
-from ui.rum_window import RumRatingsWindow
-from ui.whiskey_window import WhiskeyRatingsWindow
-from ui.cocktail_window import CocktailsWindow
 from utils.dark_theme import create_dark_palette
 from utils.light_theme import create_light_palette
 from utils.style_manager import get_table_stylesheet, get_dropdown_stylesheet, get_search_input_stylesheet
+from ui.product_table_model import DataFrameTableModel
+
+# (DataFrame column, header label, number format) of the product table
+PRODUCT_COLUMNS = [
+    ("Tuotenimi", "Product name", None), ("Hinta", "Price (€)", "{:.2f}"), ("Alkoholi%", "Alcohol (%)", "{:.1f}"),
+    ("Pullokoko (l)", "Size (L)", "{:.2f}"), ("AlcoholPerEuro", "Alcohol per €", "{:.4f}"),
+]
+
+# Delay (ms) after the last keystroke before the search runs
+SEARCH_DEBOUNCE_MS = 150
 
 def get_assets_path():
     # Return correct path to 'assets' directory
@@ -75,9 +81,17 @@ class MainWindow(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by name...")
         self.search_input.setEnabled(False) # Disabled until data loaded
-        self.search_input.textChanged.connect(self.apply_filters) # Handle text input changes
         controls_layout.addWidget(self.search_input)
 
+        # Debounce search: each keystroke restarts the timer, so only the last one of a burst runs a search
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start()) # Handle text input changes
+        self.search_input.returnPressed.connect(self.apply_filters)     # Enter searches right away
+        self.last_filter = None     # (category, search term, matching rows) of the previous filter run
+
         # Fetch button to fetch alkos product data
         self.fetch_button = QPushButton("Fetch Latest Alko Data")
         self.fetch_button.clicked.connect(self.on_fetch_data)
@@ -85,6 +99,26 @@ class MainWindow(QWidget):
 
         self.layout.addLayout(controls_layout) # add control row to main layout
 
+        # Progress bar for the background fetch (hidden while idle)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setTextVisible(True)
+        self.progress_bar.hide()
+        self.layout.addWidget(self.progress_bar)
+
+        # Background fetch worker and its thread (None while idle)
+        self.fetch_thread = None
+        self.fetch_worker = None
+        self.last_download = None   # DownloadResult of the latest fetch (None if not fetched or backup used)
+
+        # Background work started once the price list is loaded (see prewarm()), and the secondary windows,
+        # which are kept after closing and reused on the next click
+        self.prewarmed_ratings = {}     # RATING_SOURCES key -> Future of the rated products
+        self.cocktails_future = None    # Future of the loaded cocktail recipes
+        self.rum_window = None
+        self.whiskey_window = None
+        self.cocktails_window = None
+
         # Button to open Rum Ratings window
         self.rum_ratings_button = QPushButton("View Rum Ratings")
         self.rum_ratings_button.setEnabled(False)
@@ -103,75 +137,206 @@ class MainWindow(QWidget):
         self.cocktails_button.clicked.connect(self.open_cocktails_window)
         controls_layout.addWidget(self.cocktails_button)
 
-        # Table to display product data
-        self.table = QTableWidget()
+        # Price changes button (enabled once a fetch found an earlier price list to compare with)
+        self.changes_button = QPushButton("View Price Changes")
+        self.changes_button.setEnabled(False)
+        self.changes_button.clicked.connect(self.open_price_changes_window)
+        controls_layout.addWidget(self.changes_button)
+        self.price_changes = None
+
+        # Table to display product data (the model reads straight from the DataFrame columns,
+        # so only the visible rows are ever formatted)
+        self.table_model = DataFrameTableModel(PRODUCT_COLUMNS, self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.verticalHeader().setStyleSheet("color: palette(text);")
-        self.table.setColumnCount(5) # number of columns
-        self.table.setHorizontalHeaderLabels([
-            "Product name", "Price (€)", "Alcohol (%)", "Size (L)", "Alcohol per €"
-        ])
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch) # for resizing
         self.table.setAlternatingRowColors(True)    # alternate row colors
 
         self.layout.addWidget(self.table)   # add table to main layout
         self.apply_table_stylesheet()
 
+    # Secondary windows and the fetch worker are imported on first use, so the heavy libraries they pull in
+    # (pandas, rapidfuzz, requests, openpyxl) don't slow down the startup of the main window.
+
     def open_rum_window(self):
         # Open rum window with same dataset and theme (darkmode/lightmode)
-            self.rum_window = RumRatingsWindow(self.df_all, self.current_theme)
-            self.rum_window.show()
+        from ui.rum_window import RumRatingsWindow
+        self.rum_window = self._show_ratings_window(self.rum_window, RumRatingsWindow, "rum")
 
     def open_whiskey_window(self):
         # Open whiskey window with same dataset and theme (darkmode/lightmode)
-            self.whiskey_window = WhiskeyRatingsWindow(self.df_all, self.current_theme)
-            self.whiskey_window.show()
+        from ui.whiskey_window import WhiskeyRatingsWindow
+        self.whiskey_window = self._show_ratings_window(self.whiskey_window, WhiskeyRatingsWindow, "whiskey")
+
+    def _show_ratings_window(self, window, window_class, source):
+        """
+        Show the ratings window of `source`, reusing the one opened earlier.
+        It is only reloaded if the price list was fetched again since; the matching result prewarmed
+        for the current price list is used instead of matching again.
+        """
+        prepared = self.prewarmed_ratings.pop(source, None)
+        if window is None:
+            window = window_class(self.df_all, self.current_theme, self.category_index, prepared)
+        elif window.alko_df is not self.df_all:
+            window.set_products(self.df_all, self.category_index, prepared)
+        window.show()
+        window.raise_()
+        window.activateWindow()
+        return window
 
     def open_cocktails_window(self):
         try:
-            path = os.path.join(get_assets_path(), "all_drinks_metric.csv")
-            # pass along current_theme so the new window can pick it up
-            self.cocktails_window = CocktailsWindow(path, self.current_theme)
+            if self.cocktails_window is None:
+                from ui.cocktail_window import CocktailsWindow
+                path = os.path.join(get_assets_path(), "all_drinks_metric.csv")
+                # Recipes are normally loaded in the background already (waits here if still loading)
+                cocktails = self.cocktails_future.result() if self.cocktails_future is not None else None
+                # pass along current_theme so the new window can pick it up
+                self.cocktails_window = CocktailsWindow(
+                    path, self.current_theme, cocktails, self.df_all, self.category_index
+                )
+            elif self.cocktails_window.alko_df is not self.df_all:
+                self.cocktails_window.set_products(self.df_all, self.category_index)   # Fetched again since
             self.cocktails_window.show()
+            self.cocktails_window.raise_()
+            self.cocktails_window.activateWindow()
         except Exception as e:
+            self.cocktails_future = None    # Load again on the next try
             QMessageBox.critical(
                 self,
                 "Error opening cocktails",
                 f"{e.__class__.__name__}: {e}"
             )
 
+    def prewarm(self):
+        """
+        Speculatively start the slow work of the secondary windows in the background as soon as the price list
+        is loaded: rating matching for every RatingSource and loading the cocktail recipes (once per run).
+        The windows then open with their data ready instead of computing it on the first click.
+        """
+        from data.ratings import RATING_SOURCES, submit_rate_products
+        self.prewarmed_ratings = {
+            name: submit_rate_products(self.df_all, source, self.category_index)
+            for name, source in RATING_SOURCES.items()
+        }
+        if self.cocktails_future is None:
+            from data.cocktails import submit_load_cocktails
+            self.cocktails_future = submit_load_cocktails(os.path.join(get_assets_path(), "all_drinks_metric.csv"))
+
+    def open_price_changes_window(self):
+        # Show the change report of the latest fetch
+        from ui.price_changes_window import PriceChangesWindow
+        self.price_changes_window = PriceChangesWindow(self.price_changes, self.current_theme)
+        self.price_changes_window.show()
 
     def on_fetch_data(self):
         """
-        - Download and clean Data
+        - Start the download/parse pipeline in a background thread
+        - Clicking again while a fetch is running cancels it
+        """
+        if self.fetch_thread is not None:
+            self.fetch_worker.cancel()
+            self.fetch_button.setEnabled(False)     # Re-enabled once the worker has stopped
+            self.progress_bar.setFormat("Cancelling…")
+            return
+
+        from ui.fetch_worker import PriceListWorker
+        self.fetch_thread = QThread(self)
+        self.fetch_worker = PriceListWorker()
+        self.fetch_worker.moveToThread(self.fetch_thread)
+
+        self.fetch_thread.started.connect(self.fetch_worker.run)
+        self.fetch_worker.progress.connect(self.on_fetch_progress)
+        self.fetch_worker.downloaded.connect(self.on_downloaded)
+        self.fetch_worker.data_ready.connect(self.on_data_ready)
+        self.fetch_worker.changes_ready.connect(self.on_changes_ready)
+        self.fetch_worker.failed.connect(self.on_fetch_failed)
+        self.fetch_worker.cancelled.connect(self.on_fetch_cancelled)
+        self.fetch_worker.done.connect(self.fetch_thread.quit)
+        self.fetch_thread.finished.connect(self.on_fetch_thread_finished)
+
+        self.fetch_button.setText("Cancel Fetch")
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.fetch_thread.start()
+
+    def on_fetch_progress(self, percent, message):
+        # Update progress bar with the worker's current stage
+        self.progress_bar.setValue(percent)
+        self.progress_bar.setFormat(f"{message} %p%")
+
+    def on_downloaded(self, download):
+        # Transfer statistics of the fetch, shown with the timestamp once the data is published
+        self.last_download = download
+
+    def on_data_ready(self, df, used_backup):
+        """
+        Publish stage (runs on the GUI thread once the DataFrame is complete):
         - Store data
         - Update Timestamp
         - Populate Category dropdown, enable search and buttons
-        - Error if data fetch fails
         """
-        try:
-            df, used_backup = fetch_and_process_data()
-            self.df_all = df
-
-            if used_backup:
-                self.updated_label.setText("Using backup Alko dataset – latest fetch failed.")
-            else:
-                self.updated_label.setText(
-                    f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-                )
+        self.df_all = df
+        self.table_model.set_dataframe(df)
+        from data.search_index import TrigramIndex, CategoryIndex
+        self.search_index = TrigramIndex(df["Tuotenimi"].tolist())    # Built once per dataset for searching
+        self.category_index = CategoryIndex(df["Tyyppi"])             # Rows of each category
+        self.last_filter = None
+
+        if used_backup:
+            self.updated_label.setText("Using backup Alko dataset – latest fetch failed.")
+        else:
+            self.updated_label.setText(
+                f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+                + (f" (price list {self.last_download.summary()})" if self.last_download is not None else "")
+            )
 
-            # Extract categories and add to dropdown
-            categories = ["All"] + sorted(df["Tyyppi"].dropna().unique().tolist())
-            self.category_dropdown.clear()
-            self.category_dropdown.addItems(categories)
-            self.category_dropdown.setEnabled(True)
-            self.search_input.setEnabled(True)
-            self.rum_ratings_button.setEnabled(True)
-            self.whiskey_ratings_button.setEnabled(True)
-            self.cocktails_button.setEnabled(True)
-
-            self.apply_filters()    # initially populate table with full data
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Data fetch failed:\n{str(e)}")    # error if failed datafetch
+        # Extract categories and add to dropdown (signals blocked so the table is only filled once)
+        categories = ["All"] + self.category_index.categories     # Categories are already sorted
+        self.category_dropdown.blockSignals(True)
+        self.category_dropdown.clear()
+        self.category_dropdown.addItems(categories)
+        self.category_dropdown.blockSignals(False)
+        self.category_dropdown.setEnabled(True)
+        self.search_input.setEnabled(True)
+        self.rum_ratings_button.setEnabled(True)
+        self.whiskey_ratings_button.setEnabled(True)
+        self.cocktails_button.setEnabled(True)
+
+        self.apply_filters()    # initially populate table with full data
+        self.prewarm()          # Prepare ratings and cocktails for their windows
+
+    def on_changes_ready(self, changes):
+        # Keep the change report of the latest fetch (None if there was nothing to compare with)
+        self.price_changes = changes
+        self.changes_button.setEnabled(changes is not None)
+
+    def on_fetch_failed(self, message):
+        QMessageBox.critical(self, "Error", f"Data fetch failed:\n{message}")    # error if failed datafetch
+
+    def on_fetch_cancelled(self):
+        # Keep showing the previous data (if any), only the status text changes
+        if not hasattr(self, "df_all"):
+            self.updated_label.setText("Data fetch cancelled")
+
+    def on_fetch_thread_finished(self):
+        # Reset fetch controls once the worker thread has fully stopped
+        self.fetch_worker.deleteLater()
+        self.fetch_thread.deleteLater()
+        self.fetch_worker = None
+        self.fetch_thread = None
+        self.progress_bar.hide()
+        self.fetch_button.setText("Fetch Latest Alko Data")
+        self.fetch_button.setEnabled(True)
+
+    def closeEvent(self, event):
+        # Stop a running fetch before the window (and its thread) is destroyed
+        if self.fetch_thread is not None:
+            self.fetch_worker.cancel()
+            self.fetch_thread.quit()
+            self.fetch_thread.wait()
+        super().closeEvent(event)
 
 
     def apply_table_stylesheet(self):
@@ -181,40 +346,29 @@ class MainWindow(QWidget):
         self.search_input.setStyleSheet(get_search_input_stylesheet(self.current_theme))
 
     def apply_filters(self):
-        # Filter data by category and search term. delegate to populate_table
+        # Filter data by category and search term, then show the matching rows (no table rebuild)
         if not hasattr(self, "df_all"):
             return
+        self.search_timer.stop()    # A pending debounced search is covered by this run
 
         selected_category = self.category_dropdown.currentText()    # Current selected category
         search_term = self.search_input.text().strip().lower()      # Current Search text
 
-        filtered_df = self.df_all
-
-        # Filter by category if not all products
-        if selected_category != "All":
-            filtered_df = filtered_df[filtered_df["Tyyppi"] == selected_category]
+        previous = self.last_filter
+        if previous and previous[0] == selected_category and previous[1] and search_term.startswith(previous[1]):
+            # The search term was only extended, so the matches are a subset of the previous result
+            rows = previous[2]
+        elif selected_category != "All":
+            rows = self.category_index.rows(selected_category)  # Filter by category if not all products
+        else:
+            rows = range(len(self.search_index))
 
         # Filter by keyword if searchterm written
         if search_term:
-            filtered_df = filtered_df[filtered_df["Tuotenimi"].str.lower().str.contains(search_term)]
-
-        self.populate_table(filtered_df)    # Update with filterd data
-
-    def populate_table(self, df):
-        # Rebuld table according to specifications, formatting and centering text
-        self.table.setRowCount(len(df))     # set number of rows
-        for row, (_, product) in enumerate(df.iterrows()):
-            # Populate cells with relevant data
-            self.table.setItem(row, 0, QTableWidgetItem(str(product["Tuotenimi"])))
-            self.table.setItem(row, 1, QTableWidgetItem(f"{product['Hinta']:.2f}"))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{product['Alkoholi%']:.1f}"))
-            self.table.setItem(row, 3, QTableWidgetItem(f"{product['Pullokoko (l)']:.2f}"))
-            self.table.setItem(row, 4, QTableWidgetItem(f"{product['AlcoholPerEuro']:.4f}"))
-
+            rows = self.search_index.search(search_term, rows)
 
-            # Center alignment in all cells
-            for col in range(5):
-                self.table.item(row, col).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.last_filter = (selected_category, search_term, rows)
+        self.table_model.set_rows(rows)
 
     def toggle_theme(self):
         """
@@ -235,9 +389,10 @@ class MainWindow(QWidget):
         self.apply_table_stylesheet()  # Reapply table styling based on theme
 
         for w in (
-            getattr(self, "rum_window", None),
-            getattr(self, "whiskey_window", None),
-            getattr(self, "cocktails_window", None)
+            self.rum_window,
+            self.whiskey_window,
+            self.cocktails_window,
+            getattr(self, "price_changes_window", None)
         ):
             if w is not None:
                 w.current_theme = self.current_theme
@@ -0,0 +1,86 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QLabel, QTabWidget
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+import pandas as pd
+from utils.style_manager import get_table_stylesheet
+
+"""
+price_changes_window.py
+
+Window showing what changed between the previous and the latest Alko price list:
+new products, delisted products, price changes and ABV/size changes (one tab each).
+"""
+
+# (column in the diff DataFrame, header label, number format) for each tab
+PRODUCT_COLUMNS = [
+    ("Tuotenimi", "Product Name", None), ("Tyyppi", "Category", None), ("Hinta", "Price (€)", "{:.2f}"),
+    ("Alkoholi%", "Alcohol (%)", "{:.1f}"), ("Pullokoko (l)", "Size (L)", "{:.2f}"),
+]
+PRICE_COLUMNS = [
+    ("Tuotenimi", "Product Name", None), ("Tyyppi", "Category", None), ("OldPrice", "Old Price (€)", "{:.2f}"),
+    ("NewPrice", "New Price (€)", "{:.2f}"), ("Change", "Change (€)", "{:+.2f}"), ("ChangePct", "Change (%)", "{:+.1f}"),
+]
+SPEC_COLUMNS = [
+    ("Tuotenimi", "Product Name", None), ("Tyyppi", "Category", None), ("OldAlcohol%", "Old Alcohol (%)", "{:.1f}"),
+    ("NewAlcohol%", "New Alcohol (%)", "{:.1f}"), ("OldSize (l)", "Old Size (L)", "{:.2f}"),
+    ("NewSize (l)", "New Size (L)", "{:.2f}"),
+]
+
+
+class PriceChangesWindow(QWidget):
+    """Displays a PriceListDiff (see data/snapshot_diff.py)."""
+    def __init__(self, changes, theme="light"):
+        super().__init__()
+        self.setWindowTitle("Price List Changes")
+        self.resize(1200, 700)
+        self.current_theme = theme
+        self.layout = QVBoxLayout(self)
+
+        # Title and summary
+        title_label = QLabel("Price List Changes")
+        title_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout.addWidget(title_label)
+
+        info_label = QLabel(f"Changes since the previous Alko price list: {changes.summary()}")
+        info_label.setWordWrap(True)
+        info_label.setFont(QFont("Arial", 10))
+        info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout.addWidget(info_label)
+
+        # One tab (table) per kind of change
+        self.tabs = QTabWidget()
+        self.tables = []
+        for title, df, columns in (
+            ("New Products", changes.new_products, PRODUCT_COLUMNS),
+            ("Delisted Products", changes.delisted_products, PRODUCT_COLUMNS),
+            ("Price Changes", changes.price_changes, PRICE_COLUMNS),
+            ("ABV / Size Changes", changes.spec_changes, SPEC_COLUMNS),
+        ):
+            table = self._build_table(df, columns)
+            self.tables.append(table)
+            self.tabs.addTab(table, f"{title} ({len(df)})")
+        self.layout.addWidget(self.tabs)
+
+        self.apply_table_stylesheet()
+
+    def _build_table(self, df: pd.DataFrame, columns) -> QTableWidget:
+        """Create a read-only table for one part of the change report."""
+        table = QTableWidget()
+        table.setAlternatingRowColors(True)
+        table.setColumnCount(len(columns))
+        table.setHorizontalHeaderLabels([label for _, label, _ in columns])
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table.setRowCount(len(df))
+
+        for col, (name, _, fmt) in enumerate(columns):
+            for row, value in enumerate(df[name].tolist()):
+                item = QTableWidgetItem(fmt.format(value) if fmt else str(value))
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(row, col, item)
+        return table
+
+    def apply_table_stylesheet(self):
+        """Apply theme-based stylesheet to all tables."""
+        for table in self.tables:
+            table.setStyleSheet(get_table_stylesheet(self.current_theme))
@@ -0,0 +1,64 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+"""
+product_table_model.py
+
+Read-only Qt table model backed directly by the columns of a product DataFrame.
+- Cell text is formatted on demand in data(), so the view only does work for the rows that are visible
+- Filtering swaps in an array of row positions (set_rows) instead of rebuilding any items
+- Doesn't import numpy/pandas itself, so it can be created before the first fetch without slowing down startup
+"""
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    def __init__(self, columns, parent=None):
+        """
+        columns: list of (DataFrame column, header label, format string or None for plain str()).
+        """
+        super().__init__(parent)
+        self._columns = columns
+        self._values = [[] for _ in columns]    # One array/list per displayed column
+        self._rows = range(0)                   # Positions (into the column arrays) of the rows shown
+
+    def set_dataframe(self, df):
+        """Use a new DataFrame as the data source and show all of its rows."""
+        self.beginResetModel()
+        # Plain lists for text (fast indexing), numpy arrays for numbers
+        self._values = [
+            df[name].tolist() if fmt is None else df[name].to_numpy()
+            for name, _, fmt in self._columns
+        ]
+        self._rows = range(len(df))
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        """Show only the given row positions (range, list or integer numpy array, in display order)."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_position(self, row: int) -> int:
+        """Position in the source DataFrame of the given view row."""
+        return int(self._rows[row])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._values[index.column()][self._rows[index.row()]]
+            fmt = self._columns[index.column()][2]
+            return str(value) if fmt is None else fmt.format(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter     # Center alignment in all cells
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[section][1]
+        return super().headerData(section, orientation, role)
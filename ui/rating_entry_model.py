@@ -0,0 +1,91 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+
+"""
+rating_entry_model.py
+
+Model/view pieces of the user rating windows (userRatingWindow.py).
+- RatingEntryModel: product names with an editable "My Rating" column; edits are kept in the model,
+  so they survive searching and are all saved at once
+- RowSetFilterProxy: shows only a given set of source rows (e.g. the hits of a TrigramIndex search),
+  so searching hides rows instead of rebuilding any widgets
+"""
+
+NAME_COLUMN, RATING_COLUMN = 0, 1
+
+
+def parse_rating(text):
+    """Rating entered by the user as int 0–100, None for an empty entry, or ValueError if invalid."""
+    text = str(text).strip()
+    if not text:
+        return None
+    if text.isdigit() and 0 <= int(text) <= 100:    # Accept only digits between 0–100
+        return int(text)
+    raise ValueError(f"Invalid rating: {text}")
+
+
+class RatingEntryModel(QAbstractTableModel):
+    def __init__(self, product_names: list[str], ratings: dict, parent=None):
+        """
+        product_names: names in display order
+        ratings: current saved ratings {product name: rating}; names without a rating show an empty cell
+        """
+        super().__init__(parent)
+        self._names = product_names
+        self._ratings = [ratings.get(name) for name in product_names]   # Edited values, None if unrated
+
+    def ratings(self) -> dict:
+        """Current (possibly edited) rating of every product {product name: rating or None}."""
+        return dict(zip(self._names, self._ratings))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if index.column() == NAME_COLUMN:
+                return self._names[index.row()]
+            rating = self._ratings[index.row()]
+            return "" if rating is None else str(rating)
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == RATING_COLUMN:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() != RATING_COLUMN:
+            return False
+        try:
+            self._ratings[index.row()] = parse_rating(value)
+        except ValueError:
+            return False    # Keep the previous value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() == RATING_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return ("Product", "My Rating (0–100)")[section]
+        return super().headerData(section, orientation, role)
+
+
+class RowSetFilterProxy(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = None   # Source rows shown, None = all
+
+    def set_rows(self, rows):
+        """Show only the given source rows (any iterable of positions), or all rows for None."""
+        self._rows = None if rows is None else set(rows)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._rows is None or source_row in self._rows
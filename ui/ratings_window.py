@@ -0,0 +1,224 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QLabel, QPushButton, QApplication,
+    QHBoxLayout, QMessageBox
+)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont
+from utils.dark_theme import create_dark_palette
+from utils.light_theme import create_light_palette
+from utils.style_manager import get_table_stylesheet
+from data.ratings import submit_rate_products
+import pandas as pd
+
+"""
+ratings_window.py
+
+Shared window for browsing one spirit category with community ratings and the user's own ratings.
+Subclasses only set the texts, the RatingSource (data/ratings.py) and the user rating window to use,
+e.g. RumRatingsWindow and WhiskeyRatingsWindow. Matching runs in the ratings engine's worker pool,
+the table is filled once the result arrives.
+"""
+
+
+class SpiritRatingsWindow(QWidget):
+    """Window for displaying the products of one spirit category with review data and user ratings."""
+    source = None               # RatingSource of the category
+    title = ""                  # Window title and heading
+    info_text = ""
+    rate_button_text = ""
+    user_rating_window = None   # Window class for entering personal ratings
+
+    ratings_ready = pyqtSignal(object, int)     # Finished Future of the engine, load request number
+
+    def __init__(self, alko_df: pd.DataFrame, theme="light", category_index=None, prepared=None):
+        """prepared: Future of submit_rate_products() already running for alko_df (e.g. prewarmed by main_window)"""
+        super().__init__()
+        self.setWindowTitle(self.title)
+        self.resize(1400, 800)
+        self.current_theme = theme
+        self.layout = QVBoxLayout(self)
+        self.alko_df = alko_df
+        self.category_index = category_index    # CategoryIndex of alko_df (optional)
+        self.rated_df = None                    # Latest matched products
+        self.rows_by_name = {}                  # Product name -> table rows (for user rating updates)
+        self.load_request = 0                   # Only the newest load_data() result is shown
+        self.ratings_ready.connect(self.on_ratings_ready)
+
+        # Title label + info
+        title_label = QLabel(self.title)
+        title_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout.addWidget(title_label)
+
+        # Info Text
+        info_label = QLabel(self.info_text)
+        info_label.setWordWrap(True)
+        info_label.setFont(QFont("Arial", 10))
+        info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout.addWidget(info_label)
+
+        # Matching status (hidden once the table is filled)
+        self.status_label = QLabel("Matching ratings…")
+        self.status_label.setFont(QFont("Arial", 10))
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout.addWidget(self.status_label)
+
+        # Buttons row
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(10)
+        button_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        # Theme Toggle Button
+        self.theme_button = QPushButton(
+            "Switch to Dark Mode" if self.current_theme == "light" else "Switch to Light Mode")
+        self.theme_button.clicked.connect(self.toggle_theme)
+        button_layout.addWidget(self.theme_button)
+
+        # Open user rating input window (enabled once the products are matched)
+        self.btn_user_rating = QPushButton(self.rate_button_text)
+        self.btn_user_rating.setEnabled(False)
+        self.btn_user_rating.clicked.connect(self.open_user_rating_window)
+        button_layout.addWidget(self.btn_user_rating)
+
+        self.layout.addLayout(button_layout)
+
+        # Product Table
+        self.table = QTableWidget()
+        self.table.setAlternatingRowColors(True)
+        self.table.setColumnCount(9)
+        self.table.setHorizontalHeaderLabels([
+            "Product Name", "Price (€)", "Alcohol (%)", "Size (L)", "Alcohol per €", "Rating (0–100)", "Review Count", "My Rating", "Source"
+        ])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.layout.addWidget(self.table)
+
+        self.load_data(alko_df, prepared)   # Populate table with alko dataframe
+        QTimer.singleShot(0, self.adjust_column_widths) # delay resize
+        self.apply_table_stylesheet()
+
+    def apply_table_stylesheet(self):
+        """Apply theme-based stylesheet to the table."""
+        self.table.setStyleSheet(get_table_stylesheet(self.current_theme))
+
+    def toggle_theme(self):
+        """
+        - For choosing Darkmode/lightmode
+        - Update darkmode button text
+        - Restyle table and controls according to theme (darkmode etc.)
+        - Broadcast theme to other open windows (so the other rating windows and main_window also get darkmode)
+        """
+        if self.current_theme == "light":
+            QApplication.instance().setPalette(create_dark_palette())
+            self.current_theme = "dark"
+            self.theme_button.setText("Switch to Light Mode")
+        else:
+            QApplication.instance().setPalette(create_light_palette())
+            self.current_theme = "light"
+            self.theme_button.setText("Switch to Dark Mode")
+
+        self.apply_table_stylesheet()
+
+        # Update all open windows with the new theme
+        for w in QApplication.instance().topLevelWidgets():
+            if w is self:
+                continue
+            if hasattr(w, "current_theme") and hasattr(w, "apply_table_stylesheet"):
+                w.current_theme = self.current_theme
+                w.apply_table_stylesheet()
+                if hasattr(w, "theme_button"):
+                    if w.current_theme == "dark":
+                        w.theme_button.setText("Switch to Light Mode")
+                    else:
+                        w.theme_button.setText("Switch to Dark Mode")
+
+    def load_data(self, alko_df, prepared=None):
+        # Match the products with their community ratings in the engine's worker pool (see data/ratings.py)
+        self.load_request += 1
+        request = self.load_request
+        future = prepared if prepared is not None else submit_rate_products(alko_df, self.source, self.category_index)
+        future.add_done_callback(lambda done: self._emit_ratings_ready(done, request))
+
+    def set_products(self, alko_df, category_index=None, prepared=None):
+        """Reload the window for a newly fetched price list (keeps the window, replaces its products)."""
+        self.alko_df = alko_df
+        self.category_index = category_index
+        self.status_label.setText("Matching ratings…")
+        self.status_label.show()
+        self.btn_user_rating.setEnabled(False)
+        self.load_data(alko_df, prepared)
+
+    def _emit_ratings_ready(self, future, request):
+        # Runs on the worker thread: the queued signal hands the result to the GUI thread
+        try:
+            self.ratings_ready.emit(future, request)
+        except RuntimeError:
+            pass    # Window was closed and deleted while matching
+
+    def on_ratings_ready(self, future, request):
+        if request != self.load_request:
+            return  # A newer load_data() call is still running
+        try:
+            rated_df = future.result()
+        except Exception as e:
+            self.status_label.setText("Matching ratings failed")
+            QMessageBox.critical(self, "Error matching ratings", f"{e.__class__.__name__}: {e}")
+            return
+        if rated_df is None:
+            self.status_label.setText("Ratings file not found")
+            return
+
+        self.rated_df = rated_df
+        self.populate_table(rated_df)
+        self.status_label.hide()
+        self.btn_user_rating.setEnabled(True)
+        QTimer.singleShot(0, self.adjust_column_widths)
+
+    def populate_table(self, rated_df):
+        # Populate table
+        self.rows_by_name = {}
+        for row, name in enumerate(rated_df["Tuotenimi"]):
+            self.rows_by_name.setdefault(name, []).append(row)
+        self.table.setRowCount(len(rated_df))
+        for row, (_, product) in enumerate(rated_df.iterrows()):
+            self.table.setItem(row, 0, QTableWidgetItem(str(product["Tuotenimi"])))
+            self.table.setItem(row, 1, QTableWidgetItem(f"{product['Hinta']:.2f}"))
+            self.table.setItem(row, 2, QTableWidgetItem(f"{product['Alkoholi%']:.1f}"))
+            self.table.setItem(row, 3, QTableWidgetItem(f"{product['Pullokoko (l)']:.2f}"))
+            self.table.setItem(row, 4, QTableWidgetItem(f"{product['AlcoholPerEuro']:.4f}"))
+            self.table.setItem(row, 5, QTableWidgetItem("" if pd.isna(product["Rating"]) else str(product["Rating"])))
+            self.table.setItem(row, 6, QTableWidgetItem("" if pd.isna(product["ReviewCount"]) else str(product["ReviewCount"])))
+            self.table.setItem(row, 7, QTableWidgetItem(str(product["MyRating"])))
+            self.table.setItem(row, 8, QTableWidgetItem("" if pd.isna(product["Source"]) else str(product["Source"])))
+
+            for col in range(9):
+                self.table.item(row, col).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    def open_user_rating_window(self):
+        """Open a window for entering personal ratings."""
+        unique_names = sorted(set(self.rated_df["Tuotenimi"]))
+        self.rating_window = self.user_rating_window(unique_names, self.current_theme)
+        self.rating_window.saved.connect(self.update_user_ratings)
+        self.rating_window.show()
+
+    def update_user_ratings(self, changes: dict):
+        """Show changed personal ratings ({product name: rating or None}) by updating only their "My Rating" cells."""
+        column = self.rated_df.columns.get_loc("MyRating")
+        for name, rating in changes.items():
+            value = "" if rating is None else rating
+            for row in self.rows_by_name.get(name, ()):
+                self.rated_df.iat[row, column] = value
+                self.table.item(row, 7).setText(str(value))
+
+    def resizeEvent(self, event):
+        """Ensure columns are resized"""
+        super().resizeEvent(event)
+        self.adjust_column_widths()
+
+    def adjust_column_widths(self):
+        """Resize columns proportionally based on weights. (name column wider than price etc.)"""
+        column_weights = [20, 10, 10, 10, 10.5, 10, 10, 10, 15]
+        total_weight = sum(column_weights)
+        table_width = self.table.viewport().width()
+        for i, weight in enumerate(column_weights):
+            self.table.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeMode.Interactive)
+            self.table.setColumnWidth(i, int((weight / total_weight) * table_width))
@@ -0,0 +1,102 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QTableView, QPushButton, QHBoxLayout, QLineEdit, QHeaderView, QAbstractItemView
+)
+from PyQt6.QtCore import pyqtSignal
+from utils.style_manager import get_search_input_stylesheet, get_table_stylesheet
+from data.search_index import TrigramIndex
+from data.user_store import get_user_store
+from ui.rating_entry_model import RatingEntryModel, RowSetFilterProxy, NAME_COLUMN, RATING_COLUMN
+
+
+"""
+userRatingWindow.py
+
+Popup window that allows users to input their own ratings for one kind of spirit (rums, whiskeys, ...).
+Ratings are edited in a table (RatingEntryModel); the search only hides rows, so typing stays fast
+with hundreds of products. Only the changed ratings are saved to the local user store (data/user_store.py).
+"""
+
+class UserRatingWindow(QWidget):
+    saved = pyqtSignal(dict) # Changed ratings {product name: rating, or None if removed}
+
+    def __init__(self, product_names: list[str], source_name: str, theme="light", spirit="rums", store=None):
+        """
+        source_name: RatingSource name the ratings are saved under ("rum")
+        spirit: plural name of the rated products, used in the window texts.
+        store: UserStore to use (default: the one in the user's home directory)
+        """
+        super().__init__()
+        self.setWindowTitle(f"Rate {spirit.capitalize()} Yourself")
+        self.resize(500, 600)
+
+        self.source_name = source_name
+        self.store = store if store is not None else get_user_store()  # Where the ratings are saved
+        self.current_theme = theme      # Light/dark theme identifier
+        self.all_product_names = sorted(product_names)  # Full sorted list of product names
+        self.search_index = TrigramIndex(self.all_product_names)     # Substring search over the names
+
+        self.saved_ratings = self.store.load_ratings(source_name)  # Existing user ratings
+
+        self.layout = QVBoxLayout(self) # Main layout for this window
+
+        #  Search Bar
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText(f"Search {spirit}...")
+        self.search_bar.textChanged.connect(self.filter_products)   # Refilter on typing
+        self.layout.addWidget(self.search_bar)
+
+        #  Rating table: product names and an editable rating column (edits stay in the model until saved)
+        self.model = RatingEntryModel(self.all_product_names, self.saved_ratings, self)
+        self.proxy = RowSetFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.view = QTableView()
+        self.view.setModel(self.proxy)
+        self.view.setAlternatingRowColors(True)
+        self.view.verticalHeader().hide()
+        self.view.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked | QAbstractItemView.EditTrigger.SelectedClicked
+            | QAbstractItemView.EditTrigger.AnyKeyPressed | QAbstractItemView.EditTrigger.EditKeyPressed
+        )
+        header = self.view.horizontalHeader()
+        header.setSectionResizeMode(NAME_COLUMN, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(RATING_COLUMN, QHeaderView.ResizeMode.ResizeToContents)
+        self.layout.addWidget(self.view)
+        self.apply_table_stylesheet()
+
+        #  Save/Cancel Buttons
+        btns = QHBoxLayout()
+        btn_save = QPushButton("Save")
+        btn_cancel = QPushButton("Cancel")
+        btn_save.clicked.connect(self._save_and_close)  # Save + emit signal
+        btn_cancel.clicked.connect(self.close)          # Close
+        btns.addWidget(btn_save)
+        btns.addWidget(btn_cancel)
+        self.layout.addLayout(btns)
+
+    def filter_products(self, text: str):
+        """
+        Filters the product list based on the search bar text (hides the other rows)
+        """
+        query = text.strip().lower()
+        self.proxy.set_rows(self.search_index.search(query) if query else None)
+
+    def apply_table_stylesheet(self):
+        """
+        Applies styling based on the current theme dark/light.
+        """
+        self.search_bar.setStyleSheet(get_search_input_stylesheet(self.current_theme))
+        self.view.setStyleSheet(get_table_stylesheet(self.current_theme))
+
+    def _save_and_close(self):
+        """
+        Saves the changed user ratings to the store (one transaction) and closes the window.
+        Also emits `saved` with only the changed ratings, so other windows can update just those.
+        """
+        changes = {
+            name: rating for name, rating in self.model.ratings().items()
+            if rating != self.saved_ratings.get(name)
+        }
+        self.store.save_ratings(self.source_name, changes)  # Emptied ratings (None) are removed
+
+        self.saved.emit(changes)
+        self.close()
\ No newline at end of file
@@ -567,3 +567,101 @@ def normalize_ingredient(raw: str) -> str:
     key = raw.strip().lower()
     return SYNONYMS.get(key, key)
 
+
+"""
+ALKO_PRODUCTS maps the normalized ingredients that are sold at Alko to the products that can stand in for them:
+(substring of the Alko category "Tyyppi", regular expression the product name must match, or None for any product).
+ALKO_MIN_ALCOHOL gives the lowest "Alkoholi%" a product must have to stand in for the ingredient (high-proof spirits).
+Products whose name matches ALKO_EXCLUDED (sweet shots, e.g. "Hotti Chili-Vadelma Shotti") never stand in for any.
+Ingredients missing from here (juices, syrups, fruit, garnishes, ...) are bought from a grocery store.
+"""
+
+ALKO_PRODUCTS = {
+    # Spirits
+    "Rum": ("rommit", None),
+    "White Rum": ("rommit", r"white|blanc|silver|light|carta|bianco|3 a[ñn]os"),
+    "Flavored Rum": ("rommit", r"spiced|coconut|flavou?r|kookos|mauste"),
+    "Vodka": ("vodkat ja viinat", r"vodka|viina|koskenkorva"),
+    "Flavored Vodka": ("vodkat ja viinat", r"vodka.*(?:citron|lemon|vanil|raspberry|peach|apple|berry|mango|orange)"),
+    "Gin": ("ginit", r"\bgin\b"),
+    "Tequila": ("ginit ja maustetut viinat", r"tequila"),
+    "Whiskey": ("viskit", None),
+    "Flavored Whiskey": ("liköörit ja katkerot", r"whisk|bourbon|fireball"),
+    "Brandy": ("konjakit", None),
+    "Flavored Brandy": ("brandyt", None),
+    "Flavoured Brandy": ("brandyt", None),
+    "Cachaca Spirit": ("vodkat ja viinat", r"cacha[cç]a"),
+    "Aquavit": ("ginit ja maustetut viinat", r"akvavit|aquavit"),
+    "Everclear": ("vodkat ja viinat", None),
+    "Strong Spirits": ("vodkat ja viinat", None),
+
+    # Liqueurs
+    "Triple Sec": ("liköörit ja katkerot", r"triple sec|cointreau|grand marnier|cura[cç]ao"),
+    "Amaretto": ("liköörit ja katkerot", r"amaretto|disaronno"),
+    "Coffee Liqueur": ("liköörit ja katkerot", r"kahlua|kahlúa|coffee|kahvi|espresso"),
+    "Cream Liqueur": ("liköörit ja katkerot", r"cream|baileys|kerma"),
+    "Herbal Liqueur": ("liköörit ja katkerot", r"herb|yrtti|galliano|drambuie|strega|jägermeister"),
+    "Nut Liqueur": ("liköörit ja katkerot", r"hazelnut|frangelico|pähkinä|nocino|\bnut"),
+    "Elderflower Liqueur": ("liköörit ja katkerot", r"elderflower|seljankukka|st-germain"),
+    "Cinnamon Liqueur": ("liköörit ja katkerot", r"cinnamon|kaneli|fireball"),
+    "Anise Liqueur": ("ginit ja maustetut viinat", r"sambuca|ouzo|pastis|anis|raki"),
+    "Blackcurrant Liqueur": ("liköörit ja katkerot", r"cassis|mustaherukka|blackcurrant"),
+    "Raspberry Liqueur": ("liköörit ja katkerot",
+                          r"^(?!.*(?:sour|salmiakki|chili|liquorice)).*(?:raspberry|vadelma|chambord|framboise)"),
+    "Melon Liqueur": ("liköörit ja katkerot", r"melon|midori"),
+    "Blueberry Liqueur": ("liköörit ja katkerot", r"blueberry|mustikka"),
+    "Butterscotch Liqueur": ("liköörit ja katkerot", r"butterscotch|toffee|kinuski|caramel"),
+    "Apple Liqueur": ("liköörit ja katkerot", r"apple|omena|pomme"),
+    "Peach Liqueur": ("liköörit ja katkerot", r"peach|persikka|pêche"),
+    "Banana Liqueur": ("liköörit ja katkerot", r"banana|banaani"),
+    "Chocolate Liqueur": ("liköörit ja katkerot", r"chocolate|suklaa|cacao|cocoa"),
+    "Chocolate liqueur": ("liköörit ja katkerot", r"chocolate|suklaa|cacao|cocoa"),
+    "Peppermint Liqueur": ("liköörit ja katkerot", r"mint|minttu|menthe"),
+    "Vanilla Liqueur": ("liköörit ja katkerot", r"vanil"),
+    "Coconut Liqueur": ("liköörit ja katkerot", r"coconut|kookos|malibu"),
+    "Strawberry Liqueur": ("liköörit ja katkerot", r"strawberry|mansikka|fraise"),
+    "Cherry Liqueur": ("liköörit ja katkerot", r"cherry|kirsikka|maraschino|kirsch"),
+    "Blackberry Liqueur": ("liköörit ja katkerot", r"blackberry|karhunvatukka|mûre|mure"),
+    "Kiwi Liqueur": ("liköörit ja katkerot", r"kiwi"),
+    "Egg Liqueur": ("liköörit ja katkerot", r"advocaat|munalikööri|egg"),
+    "Kummel Liqueur": ("liköörit ja katkerot", r"k[üu]mmel"),
+    "Chartreuse": ("liköörit ja katkerot", r"chartreuse"),
+    "Benedictine": ("liköörit ja katkerot", r"b[ée]n[ée]dictine"),
+    "Campari": ("liköörit ja katkerot", r"campari"),
+    "Aperol": ("juomasekoitukset", r"^aperol$"),
+    "Jägermeister": ("liköörit ja katkerot", r"jägermeister"),
+    "Bitters": ("liköörit ja katkerot", r"\bbitters\b|angostura"),
+
+    # Wines & Fortified
+    "Wine": ("punaviinit", None),
+    "Red Wine": ("punaviinit", None),
+    "Sparkling Wine": ("kuohuviinit", None),
+    "Fortified Wine": ("jälkiruokaviinit", r"\bport\b|porto|sherry|madeira|marsala"),
+    "Vermouth": ("jälkiruokaviinit", r"vermouth|vermut|martini"),
+    "Sweet Vermouth": ("jälkiruokaviinit", r"(?:vermouth|vermut|martini).*(?:rosso|red|sweet)"),
+    "Dry Vermouth": ("jälkiruokaviinit", r"(?:vermouth|vermut|martini|noilly).*(?:dry|secco)|dry vermouth"),
+    "Sherry": ("jälkiruokaviinit", r"sherry|jerez|fino|amontillado|oloroso"),
+
+    # Beer & cider
+    "Beer": ("oluet", None),
+    "Cider": ("siiderit", None),
+}
+
+# Shots are sold among the liqueurs but flavoured (chili, salmiakki, ...) and much weaker than the liqueur they name
+ALKO_EXCLUDED = r"\bshots?\b|shotti"
+
+# Base spirits must be at least the usual bottling strength: their categories also hold 15-30% "spirit drinks",
+# flavoured or pre-mixed products (e.g. "Koskenkorva Spirit Drink 21%", "Gin Lemon"); neutral high-proof spirits 60%
+ALKO_MIN_ALCOHOL = {
+    "Rum": 37.5,
+    "White Rum": 37.5,
+    "Vodka": 37.5,
+    "Gin": 37.5,
+    "Tequila": 35.0,
+    "Whiskey": 40.0,
+    "Brandy": 36.0,
+    "Cachaca Spirit": 38.0,
+    "Aquavit": 37.5,
+    "Everclear": 60.0,
+    "Strong Spirits": 60.0,
+}
@@ -0,0 +1,95 @@
+"""
+startup_timer.py
+
+Optional cold-start timing report for main.py.
+Set the environment variable BUDGETBARSHELF_STARTUP_TIMING to enable it:
+- "1" prints the report to stderr
+- Any other value is used as a file path and the report is written there
+  (useful for the packaged .exe, which has no console)
+
+The report lists the duration of each startup phase, the time until the first window was shown,
+and the slowest module imports (cumulative, i.e. including the imports they trigger).
+Import this module first in main.py, so the clock starts as early as possible.
+"""
+import builtins
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ENV_VAR = "BUDGETBARSHELF_STARTUP_TIMING"
+ENABLED = bool(os.environ.get(ENV_VAR))
+
+# Imports faster than this (seconds) are left out of the report
+MIN_REPORTED_IMPORT = 0.005
+# Nesting depth of imports listed in the report (1 = imported directly by application code)
+MAX_REPORTED_DEPTH = 3
+
+_start = time.perf_counter()
+_phases = []        # (name, seconds)
+_imports = []       # [depth, module name, seconds] in the order the imports started
+_depth = 0
+_original_import = builtins.__import__
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """builtins.__import__ replacement that records how long each first-time import takes."""
+    global _depth
+    if level != 0 or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    entry = [_depth, name, 0.0]
+    _imports.append(entry)
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _depth -= 1
+        entry[2] = time.perf_counter() - start
+
+
+def install():
+    """Start recording import times (no-op unless the environment variable is set)."""
+    if ENABLED:
+        builtins.__import__ = _timed_import
+
+
+@contextmanager
+def phase(name: str):
+    """Time a named startup phase: `with phase("create window"): ...`"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases.append((name, time.perf_counter() - start))
+
+
+def first_window_shown():
+    """
+    Call once the first window has been shown (e.g. from a zero-delay QTimer after window.show(),
+    which runs when the event loop has started). Writes the report and stops recording imports.
+    """
+    if not ENABLED:
+        return
+    total = time.perf_counter() - _start
+    builtins.__import__ = _original_import
+
+    lines = ["Startup timing report", "", "Phases:"]
+    lines += [f"  {name:<32} {seconds * 1000:8.1f} ms" for name, seconds in _phases]
+    lines += [f"  {'time to first window':<32} {total * 1000:8.1f} ms", "", "Imports (cumulative, in load order):"]
+    for depth, name, seconds in _imports:
+        if depth < MAX_REPORTED_DEPTH and seconds >= MIN_REPORTED_IMPORT:
+            lines.append(f"  {'  ' * depth}{name:<{32 - 2 * depth}} {seconds * 1000:8.1f} ms")
+    report = "\n".join(lines) + "\n"
+
+    target = os.environ.get(ENV_VAR)
+    if target.lower() not in ("1", "true", "yes"):
+        try:
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(report)
+            return
+        except OSError:
+            pass    # Fall back to stderr
+    if sys.stderr is not None:
+        sys.stderr.write(report)
@@ -1,8 +1,9 @@
+# QTableView selectors also match QTableWidget (a QTableView subclass), so one stylesheet serves both
 def get_table_stylesheet(theme: str) -> str:
     # Return css style for either darkmode or lightmode
     if theme == "dark":
         return """
-            QTableWidget {
+            QTableView {
                 background-color: palette(base);
                 alternate-background-color: palette(alternate-base);
                 color: palette(text);
@@ -11,10 +12,10 @@ def get_table_stylesheet(theme: str) -> str:
                 gridline-color: palette(dark);
                 font-size: 11pt;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px;
             }
-            QTableWidget::item:!selected:hover {
+            QTableView::item:!selected:hover {
                 background-color: transparent;
             }
             QHeaderView::section {
@@ -27,7 +28,7 @@ def get_table_stylesheet(theme: str) -> str:
         """
     else:
         return """
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 alternate-background-color: #f2f2f2;
                 color: black;
@@ -36,10 +37,10 @@ def get_table_stylesheet(theme: str) -> str:
                 gridline-color: #ccc;
                 font-size: 11pt;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px;
             }
-            QTableWidget::item:!selected:hover {
+            QTableView::item:!selected:hover {
                 background-color: #f2f2f2;
             }
             QHeaderView::section {